@@ -11,25 +11,62 @@ CHANGES:
 
 import streamlit as st
 from PIL import Image
+# Register only the formats the uploader accepts (jpg/jpeg/png/webp) at import
+# time, so the first Image.open() of a WebP upload doesn't fall back to
+# Image.init() and import every Pillow plugin
+from PIL import JpegImagePlugin, PngImagePlugin, WebPImagePlugin  # noqa: F401
 import sys
 import os
+import hashlib
+import traceback
+import queue
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, wait
 
-# Import custom modules - FIXED IMPORTS
-from text_processor import TextProcessor
-from image_retriever_COMPLETE import ImageRetrieverComplete as ImageRetriever  # ✅ FIXED!
-from dual_verifier import DualVerifier
-from explanation_generator import ExplanationGenerator
+# Custom modules are imported where first used (load_models, get_retriever,
+# load_uploaded_image), so the page renders before they load
 
-# Page configuration
-st.set_page_config(
-    page_title="Dual Input Incident Verification",
-    page_icon="🔍",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Uploaded images are downscaled to fit within this box before verification
+UPLOAD_IMAGE_SIZE = (512, 512)
 
-# Custom CSS
-st.markdown("""
+# Retrieved images are displayed from thumbnails of this size
+THUMBNAIL_SIZE = (256, 256)
+GRID_IMAGE_WIDTH = 200
+PREVIEW_IMAGE_WIDTH = 400
+
+# Text results needed at this dHash similarity to the upload (at most ~10 of
+# 64 bits differ: a copy of the same picture) before the separate
+# similar-image search is skipped
+SIMILAR_SKIP_THRESHOLD = 0.85
+SIMILAR_SKIP_MIN_MATCHES = 3
+
+# The "<event> incident" search is also skipped when its words overlap the
+# text query this much (token Jaccard), i.e. it would return the same images
+QUERY_OVERLAP_THRESHOLD = 0.9
+
+# Result box CSS class for each dual-verification verdict (others: 'uncertain')
+VERDICT_CSS_CLASSES = {
+    'MATCH_AND_REAL': 'real',
+    'BOTH_REAL_DIFFERENT_INCIDENTS': 'mismatch',
+    'PARTIAL_FAKE': 'fake'
+}
+
+# Credibility badge markup and the CSS class for each credibility level
+BADGE_TEMPLATE = '**{source}** <span class="credibility-badge {badge_class}">{credibility}</span>'
+TEXT_BADGE_CLASSES = {
+    'TIER1_GLOBAL': 'tier1',
+    'TIER2_INDIA': 'tier2',
+    'TIER3_REGIONAL': 'tier3',
+    'SOCIAL_MEDIA': 'regional'
+}
+SIMILAR_BADGE_CLASSES = {
+    'TIER1_GLOBAL': 'tier1',
+    'TIER2_INDIA': 'tier2',
+    'TIER3_REGIONAL': 'tier3'
+}
+
+# Page styles and sidebar help text (built once at import, re-sent each rerun)
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -91,46 +128,309 @@ st.markdown("""
         color: white;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+# Collapse whitespace once so each rerun sends a smaller message
+CUSTOM_CSS = " ".join(CUSTOM_CSS.split())
+
+SIDEBAR_HELP = (
+    "**💡 How it works:**\n\n"
+    "**Text + Image Together:**\n"
+    "• Checks if both describe same incident\n"
+    "• Verifies both against web sources\n"
+    "• Detects mismatches\n"
+    "• Shows proof images\n\n"
+    "**Text Only:**\n"
+    "• Retrieves images from web\n"
+    "• Verifies incident authenticity\n\n"
+    "**Image Only:**\n"
+    "• Reverse image search\n"
+    "• Finds similar images online\n"
+    "• Verifies authenticity"
+)
+
+# Page configuration
+st.set_page_config(
+    page_title="Dual Input Incident Verification",
+    page_icon="🔍",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Initialize session state
-if 'initialized' not in st.session_state:
-    st.session_state.initialized = False
-    st.session_state.text_processor = None
-    st.session_state.verifier = None
-    st.session_state.explanation_gen = None
+if 'last_result' not in st.session_state:
+    st.session_state.last_result = None
+
+# Model loaders for load_models: each imports its module on first use
+
+def load_text_processor():
+    """Import and construct the text processor"""
+    from text_processor import TextProcessor
+    return TextProcessor()
+
+def load_verifier():
+    """Import and construct the dual verifier"""
+    from dual_verifier import DualVerifier
+    return DualVerifier()
+
+def load_explanation_generator():
+    """Import and construct the explanation generator"""
+    from explanation_generator import ExplanationGenerator
+    return ExplanationGenerator()
 
 @st.cache_resource
 def load_models():
-    """Load models with caching"""
-    try:
-        with st.spinner("Loading AI models... This may take a few minutes on first run."):
-            text_processor = TextProcessor()
-            verifier = DualVerifier()
-            explanation_gen = ExplanationGenerator()
-        return text_processor, verifier, explanation_gen
-    except Exception as e:
-        st.error(f"Error loading models: {e}")
-        return None, None, None
+    """
+    Load models with caching
+    
+    The three model modules are imported and constructed concurrently, so
+    the page renders before their imports run. Raises RuntimeError naming
+    the model that failed (import or construction); failures are not
+    cached, so the next rerun retries.
+    """
+    with st.spinner("Loading AI models... This may take a few minutes on first run."):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'text processor': executor.submit(load_text_processor),
+                'verifier': executor.submit(load_verifier),
+                'explanation generator': executor.submit(load_explanation_generator)
+            }
+    
+    for name, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            raise RuntimeError(f"Error loading {name}: {error}") from error
+    
+    return tuple(future.result() for future in futures.values())
+
+@st.cache_resource
+def get_retriever():
+    """Build the image retriever once per process and share it across reruns"""
+    from image_retriever_COMPLETE import ImageRetrieverComplete as ImageRetriever  # ✅ FIXED!
+    return ImageRetriever()
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=1000, show_spinner=False)
+def process_text_cached(text):
+    """
+    Process text once per distinct input string (pure str -> dict call)
+    
+    Entries expire after a day and the cache is bounded, so a long-running
+    server does not keep every text ever submitted
+    """
+    text_processor, _, _ = load_models()
+    return text_processor.process_text(text)
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def retrieve_images_cached(query, max_images, location=None, event_type=None, keywords=None, _on_image=None):
+    """
+    Retrieve web images once per query (expires hourly as news images change)
+    
+    Each entry holds up to 20 decoded images with their thumbnails, so only
+    the most recent queries are kept
+    
+    _on_image (not part of the cache key) is called with each image as it
+    downloads, so a cache miss can show images progressively. It must not
+    render anything itself: st.cache_data replays element calls made in
+    here on later hits (see retrieve_images_streaming).
+    """
+    images = get_retriever().retrieve_images_for_text(
+        query=query,
+        max_images=max_images,
+        location=location,
+        event_type=event_type,
+        keywords=keywords,
+        on_image=_on_image
+    )
+    # Thumbnails are built here so they ride along in the cached result
+    return add_thumbnails(images)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def reverse_search_cached(image_key, _image, max_results=20):
+    """
+    Reverse image search once per distinct upload, across sessions
+    
+    image_key (a hash of the uploaded bytes) stands in for the image in the
+    cache key; _image itself is not hashed
+    """
+    return get_retriever().reverse_image_search(image=_image, max_results=max_results)
+
+def retrieve_text_and_image_evidence(text_info, max_images, image_key, user_image):
+    """
+    Retrieve images for the text, images similar to the uploaded image, and
+    the reverse image search result
+    
+    The text search runs while the reverse search does. Reverse search hits
+    are source evidence only: they carry no downloaded picture, so they are
+    not scored as similar images (that would compare the upload with
+    itself). The similar images come from a second "<event> incident"
+    search, unless that query is effectively the text query or the text
+    images already resemble the upload (then the text images are reused).
+    
+    Returns (text_based_images, image_based_images, reverse_result)
+    """
+    text_query = dict(
+        query=text_info['search_query'],
+        max_images=max_images,
+        location=text_info.get('location'),
+        event_type=text_info.get('event_type'),
+        keywords=text_info.get('keywords')
+    )
+    caption = f"{text_info['event_type']} incident"
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text_future = executor.submit(retrieve_images_cached, **text_query)
+        reverse_result = reverse_search_cached(image_key, user_image)
+        
+        if (query_overlap(caption, text_info['search_query']) >= QUERY_OVERLAP_THRESHOLD
+              or resembles_upload(user_image, text_future.result())):
+            image_based_images = text_future.result()[:max_images // 2]
+        else:
+            # Similar images (backward compatibility)
+            image_based_images = executor.submit(
+                retrieve_images_cached,
+                query=caption,
+                max_images=max_images // 2
+            ).result()
+        
+        return text_future.result(), image_based_images, reverse_result
+
+def query_overlap(query1, query2):
+    """Token Jaccard similarity of two search queries (case-insensitive)"""
+    tokens1 = set(query1.lower().split())
+    tokens2 = set(query2.lower().split())
+    if not tokens1 or not tokens2:
+        return 0.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+def resembles_upload(user_image, retrieved_images):
+    """
+    Whether enough retrieved images already look like the uploaded image
+    for another search to add nothing
+    """
+    if len(retrieved_images) < SIMILAR_SKIP_MIN_MATCHES:
+        return False
+    
+    from dual_verifier import batch_dhash_similarity
+    
+    similarities = batch_dhash_similarity(
+        user_image, [img_data['image'] for img_data in retrieved_images]
+    )
+    return (similarities >= SIMILAR_SKIP_THRESHOLD).sum() >= SIMILAR_SKIP_MIN_MATCHES
+
+def occurrences_to_images(reverse_result, user_image, limit=10):
+    """
+    Turn reverse search occurrences into retrieved-image dicts
+    
+    All entries reference the same user_image object (no copies)
+    """
+    return [
+        {
+            'image': user_image,  # Placeholder (could download from URL)
+            'source': occ.get('domain', 'Unknown'),
+            'name': occ.get('title', 'Unknown'),
+            'url': occ.get('url', ''),
+            'credibility': occ.get('credibility', 'UNKNOWN')
+        }
+        for occ in reverse_result['all_occurrences'][:limit]
+    ]
+
+def session_memo(name, key, compute):
+    """
+    Return the value stored in session state under `name` if it was computed
+    for the same `key`; otherwise compute and store it. Lets a Verify click
+    skip work for inputs that did not change (works for unhashable values
+    such as PIL images, unlike st.cache_data).
+    """
+    stored = st.session_state.get(name)
+    if stored is not None and stored[0] == key:
+        return stored[1]
+    
+    value = compute()
+    st.session_state[name] = (key, value)
+    return value
+
+def image_to_webp(image, quality=80):
+    """Encode a PIL image as WebP bytes (much smaller over the wire than PNG)"""
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    # method=0 is the fastest WebP encoder setting
+    image.save(buffer, format='WEBP', quality=quality, method=0)
+    return buffer.getvalue()
+
+def make_thumbnail(image, size=THUMBNAIL_SIZE):
+    """Downscale a copy of the image to fit `size` and encode it as WebP"""
+    thumb = image.copy()
+    thumb.thumbnail(size, Image.Resampling.BILINEAR)
+    return image_to_webp(thumb, quality=75)
+
+def add_thumbnails(images):
+    """Attach a small WebP thumbnail ('thumb') to each retrieved image, once"""
+    for img_data in images:
+        if 'thumb' not in img_data:
+            img_data['thumb'] = make_thumbnail(img_data['image'])
+    return images
+
+def load_uploaded_image(image_bytes):
+    """
+    Decode an upload into the (downscaled) verification image and a
+    display-sized WebP preview
+    """
+    from image_retriever_COMPLETE import decode_image
+    
+    # JPEGs go through simplejpeg when installed, at reduced DCT scale
+    user_image = decode_image(image_bytes, UPLOAD_IMAGE_SIZE)
+    # Downscale early: draft() lets libjpeg decode at reduced scale
+    # (no-op for non-JPEG) and the verifier only needs a small image
+    user_image.draft('RGB', UPLOAD_IMAGE_SIZE)
+    user_image.thumbnail(UPLOAD_IMAGE_SIZE, Image.Resampling.BILINEAR)
+    # Convert once here (after the downscale) so that display, thumbnails
+    # and the verifier all receive RGB and skip their own conversion
+    if user_image.mode != 'RGB':
+        user_image = user_image.convert('RGB')
+    preview = make_thumbnail(user_image, (PREVIEW_IMAGE_WIDTH, PREVIEW_IMAGE_WIDTH))
+    return user_image, preview
+
+def retrieve_images_streaming(placeholder, **query):
+    """
+    retrieve_images_cached, showing each image in placeholder as it downloads
+    
+    The search runs in a worker thread and only queues the downloaded images
+    (thumbnail attached); they are rendered here, outside the cached function.
+    On a cache hit nothing is queued and the cached images are returned.
+    """
+    downloaded = queue.Queue()
+    
+    def enqueue(img_data):
+        downloaded.put(add_thumbnails([img_data])[0])
+    
+    thumbs = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(retrieve_images_cached, _on_image=enqueue, **query)
+        while True:
+            finished = future.done()
+            while not downloaded.empty():
+                thumbs.append(downloaded.get()['thumb'])
+                placeholder.image(thumbs, width=GRID_IMAGE_WIDTH)
+            if finished:
+                break
+            wait([future], timeout=0.1)
+    
+    return future.result()
 
 def main():
     # Header
     st.markdown('<p class="main-header">🔍 Dual-Input Incident Verification System</p>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Verify incidents using Text + Image together or separately</p>', unsafe_allow_html=True)
     
-    # Load models
-    if not st.session_state.initialized:
+    # Load models (cache_resource memoizes the tuple process-wide)
+    try:
         text_processor, verifier, explanation_gen = load_models()
-        
-        if text_processor and verifier and explanation_gen:
-            st.session_state.text_processor = text_processor
-            st.session_state.verifier = verifier
-            st.session_state.explanation_gen = explanation_gen
-            st.session_state.initialized = True
-            st.success("✓ Models loaded successfully!")
-        else:
-            st.error("Failed to load models. Please restart the application.")
-            return
+    except RuntimeError as e:
+        st.error(f"Failed to load models ({e}). Please restart the application.")
+        return
     
     # Sidebar configuration
     st.sidebar.title("⚙️ Configuration")
@@ -144,21 +444,7 @@ def main():
     )
     
     st.sidebar.markdown("---")
-    st.sidebar.info(
-        "**💡 How it works:**\n\n"
-        "**Text + Image Together:**\n"
-        "• Checks if both describe same incident\n"
-        "• Verifies both against web sources\n"
-        "• Detects mismatches\n"
-        "• Shows proof images\n\n"
-        "**Text Only:**\n"
-        "• Retrieves images from web\n"
-        "• Verifies incident authenticity\n\n"
-        "**Image Only:**\n"
-        "• Reverse image search\n"
-        "• Finds similar images online\n"
-        "• Verifies authenticity"
-    )
+    st.sidebar.info(SIDEBAR_HELP)
     
     # Main input area
     st.header("📝 Enter Incident Information")
@@ -184,8 +470,15 @@ def main():
         )
         
         if uploaded_file:
-            user_image = Image.open(uploaded_file)
-            st.image(user_image, caption="Uploaded Image", use_column_width=True)
+            # Decoded once per upload; later reruns reuse the image
+            image_bytes = uploaded_file.getvalue()
+            image_key = hashlib.md5(image_bytes).hexdigest()
+            user_image, preview = session_memo(
+                'upload',
+                image_key,
+                lambda: load_uploaded_image(image_bytes)
+            )
+            st.image(preview, caption="Uploaded Image", width=PREVIEW_IMAGE_WIDTH)
     
     # Verify button
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -201,162 +494,171 @@ def main():
             st.error("❌ Please provide at least TEXT or IMAGE or both")
             return
         
+        # Forget the previous run's results
+        st.session_state.last_result = None
+        
         try:
             # CASE 1: Both Text and Image provided
             if has_text and has_image:
-                st.info("🔄 Mode: TEXT + IMAGE Verification")
-                
-                # Process text
-                with st.spinner("Processing text..."):
-                    text_info = st.session_state.text_processor.process_text(text_input)
-                st.success("✓ Text processed")
-                
-                # Initialize retriever - FIXED
-                retriever = ImageRetriever()  # ✅ Now uses ImageRetrieverComplete
-                
-                # Retrieve images based on text
-                with st.spinner("Retrieving images based on TEXT..."):
-                    text_based_images = retriever.retrieve_images_for_text(  # ✅ FIXED method name
-                        query=text_info['search_query'],
-                        max_images=max_images,
-                        location=text_info.get('location'),
-                        event_type=text_info.get('event_type'),
-                        keywords=text_info.get('keywords')
-                    )
-                
-                if text_based_images:
-                    st.success(f"✓ Retrieved {len(text_based_images)} images for text")
-                else:
-                    st.warning("⚠️ Could not retrieve images for text")
-                
-                # Reverse image search - NEW FEATURE!
-                with st.spinner("Performing reverse image search (finding original source)..."):
-                    reverse_result = retriever.reverse_image_search(
-                        image=user_image,
-                        max_results=20
-                    )
-                
-                if reverse_result.get('all_occurrences'):
-                    st.success(f"✓ Found {len(reverse_result['all_occurrences'])} occurrences of uploaded image")
+                # One status container collects the progress log of this run
+                with st.status("🔄 Mode: TEXT + IMAGE Verification", expanded=True) as status:
+                    # Process text
+                    status.update(label="Processing text...")
+                    text_info = process_text_cached(text_input)
+                    st.write("✓ Text processed")
                     
-                    # Show original source
-                    if reverse_result.get('original_source'):
-                        orig = reverse_result['original_source']
-                        st.info(f"🎯 Original source: **{orig.get('domain', 'Unknown')}**")
-                else:
-                    st.warning("⚠️ No reverse search results (image may be new/original)")
-                
-                # Retrieve similar images (backward compatibility)
-                with st.spinner("Searching for similar images..."):
-                    caption = f"{text_info['event_type']} incident"
-                    image_based_images = retriever.retrieve_images_for_text(
-                        query=caption,
-                        max_images=max_images // 2
+                    # Retrieve images based on text, similar images and the
+                    # reverse image search (reused from the previous click if
+                    # text, slider and image are unchanged)
+                    status.update(label="Retrieving images based on TEXT and performing reverse image search...")
+                    text_based_images, image_based_images, reverse_result = session_memo(
+                        'dual_retrieval',
+                        (text_input, max_images, image_key),
+                        lambda: retrieve_text_and_image_evidence(text_info, max_images, image_key, user_image)
                     )
-                
-                # Perform dual verification
-                with st.spinner("Cross-verifying text and image..."):
-                    result = st.session_state.verifier.verify_text_and_image(
+                    
+                    if text_based_images:
+                        st.write(f"✓ Retrieved {len(text_based_images)} images for text")
+                    else:
+                        st.write("⚠️ Could not retrieve images for text")
+                    
+                    if reverse_result.get('all_occurrences'):
+                        st.write(f"✓ Found {len(reverse_result['all_occurrences'])} occurrences of uploaded image")
+                        
+                        # Show original source
+                        if reverse_result.get('original_source'):
+                            orig = reverse_result['original_source']
+                            st.write(f"🎯 Original source: **{orig.get('domain', 'Unknown')}**")
+                    else:
+                        st.write("⚠️ No reverse search results (image may be new/original)")
+                    
+                    # Perform dual verification
+                    status.update(label="Cross-verifying text and image...")
+                    result = verifier.verify_text_and_image(
                         text_input,
                         user_image,
                         text_based_images,
                         image_based_images
                     )
+                    
+                    status.update(label="✓ Verification complete", state="complete", expanded=False)
                 
-                st.success("✓ Verification complete")
-                
-                # Display results
-                display_dual_verification_results(
-                    result,
-                    text_based_images,
-                    image_based_images,
-                    user_image,
-                    reverse_result
+                # Store results - rendered below, and on later reruns
+                st.session_state.last_result = (
+                    'dual',
+                    (result, text_based_images, image_based_images, user_image, reverse_result)
                 )
             
             # CASE 2: Only Text provided
             elif has_text and not has_image:
-                st.info("🔄 Mode: TEXT Only Verification")
-                
-                # Process text
-                with st.spinner("Processing text..."):
-                    text_info = st.session_state.text_processor.process_text(text_input)
-                st.success("✓ Text processed")
-                
-                # Initialize retriever
-                retriever = ImageRetriever()  # ✅ FIXED
-                
-                # Retrieve images
-                with st.spinner("Retrieving images from web..."):
-                    retrieved_images = retriever.retrieve_images_for_text(  # ✅ FIXED
+                with st.status("🔄 Mode: TEXT Only Verification", expanded=True) as status:
+                    # Process text
+                    status.update(label="Processing text...")
+                    text_info = process_text_cached(text_input)
+                    st.write("✓ Text processed")
+                    
+                    # Retrieve images, showing each one as soon as it downloads
+                    status.update(label="Retrieving images from web...")
+                    preview = st.empty()
+                    retrieved_images = retrieve_images_streaming(
+                        preview,
                         query=text_info['search_query'],
                         max_images=max_images,
                         location=text_info.get('location'),
                         event_type=text_info.get('event_type'),
                         keywords=text_info.get('keywords')
                     )
-                
-                if retrieved_images:
-                    st.success(f"✓ Retrieved {len(retrieved_images)} images")
+                    preview.empty()
                     
-                    # Verify
-                    with st.spinner("Verifying incident..."):
-                        result = st.session_state.verifier.verify_text_only(
+                    if retrieved_images:
+                        st.write(f"✓ Retrieved {len(retrieved_images)} images")
+                        
+                        # Verify
+                        status.update(label="Verifying incident...")
+                        result = verifier.verify_text_only(
                             text_input,
                             retrieved_images
                         )
-                    
-                    st.success("✓ Verification complete")
-                    display_text_only_results(result, retrieved_images)
-                else:
-                    st.error("❌ No images found. Cannot verify.")
+                        
+                        status.update(label="✓ Verification complete", state="complete", expanded=False)
+                        st.session_state.last_result = ('text', (result, retrieved_images))
+                    else:
+                        status.update(label="❌ No images found. Cannot verify.", state="error")
             
             # CASE 3: Only Image provided
             elif not has_text and has_image:
-                st.info("🔄 Mode: IMAGE Only Verification")
-                
-                # Initialize retriever
-                retriever = ImageRetriever()  # ✅ FIXED
-                
-                # Reverse image search - MAIN FEATURE FOR IMAGE-ONLY!
-                with st.spinner("Performing reverse image search..."):
-                    reverse_result = retriever.reverse_image_search(
-                        image=user_image,
-                        max_results=20
+                with st.status("🔄 Mode: IMAGE Only Verification", expanded=True) as status:
+                    # Reverse image search - MAIN FEATURE FOR IMAGE-ONLY!
+                    status.update(label="Performing reverse image search...")
+                    reverse_result = session_memo(
+                        'reverse_search',
+                        image_key,
+                        lambda: reverse_search_cached(image_key, user_image)
                     )
-                
-                if reverse_result.get('all_occurrences'):
-                    st.success(f"✓ Found {len(reverse_result['all_occurrences'])} occurrences")
                     
-                    # Extract images from reverse search
-                    retrieved_images = []
-                    for occ in reverse_result['all_occurrences'][:10]:
-                        # Create image dict format
-                        retrieved_images.append({
-                            'image': user_image,  # Placeholder (could download from URL)
-                            'source': occ.get('domain', 'Unknown'),
-                            'name': occ.get('title', 'Unknown'),
-                            'url': occ.get('url', ''),
-                            'credibility': occ.get('credibility', 'UNKNOWN')
-                        })
-                    
-                    # Verify
-                    with st.spinner("Verifying image..."):
-                        result = st.session_state.verifier.verify_image_only(
+                    if reverse_result.get('all_occurrences'):
+                        st.write(f"✓ Found {len(reverse_result['all_occurrences'])} occurrences")
+                        
+                        # Extract images from reverse search
+                        retrieved_images = occurrences_to_images(reverse_result, user_image)
+                        
+                        # Verify
+                        status.update(label="Verifying image...")
+                        result = verifier.verify_image_only(
                             user_image,
                             retrieved_images
                         )
-                    
-                    st.success("✓ Verification complete")
-                    display_image_only_results(result, retrieved_images, user_image, reverse_result)
-                else:
-                    st.warning("⚠️ No similar images found. Cannot verify.")
+                        
+                        status.update(label="✓ Verification complete", state="complete", expanded=False)
+                        st.session_state.last_result = (
+                            'image',
+                            (result, retrieved_images, user_image, reverse_result)
+                        )
+                    else:
+                        status.update(label="⚠️ No similar images found. Cannot verify.", state="error")
         
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
-            st.exception(e)
+            # The traceback goes to the server log; it is only rendered in
+            # the page when debugging (DUAL_PRP_DEBUG=1)
+            traceback.print_exc()
+            if os.environ.get('DUAL_PRP_DEBUG'):
+                st.exception(e)
+    
+    # Show the latest results. They live in session state so that widget
+    # changes (e.g. the sidebar slider) re-render them without re-verifying.
+    if st.session_state.get('last_result'):
+        display_last_result()
 
 
+def display_last_result():
+    """Display the most recent verification result stored in session state"""
+    mode, args = st.session_state.last_result
+    RESULT_DISPLAYS[mode](*args)
+
+
+def display_image_grid(images, captions, badge_classes=None):
+    """Render retrieved thumbnails with one st.image call (plus one badge row)"""
+    st.image(
+        [img_data['thumb'] for img_data in images],
+        caption=captions,
+        width=GRID_IMAGE_WIDTH
+    )
+    
+    # Credibility badges for all shown sources in a single markdown block
+    if badge_classes is not None:
+        badges = []
+        for img_data in images:
+            credibility = img_data.get('credibility', 'UNKNOWN')
+            badges.append(BADGE_TEMPLATE.format_map({
+                'source': img_data.get('source', 'Unknown')[:30],
+                'badge_class': badge_classes.get(credibility, 'tier3'),
+                'credibility': credibility
+            }))
+        st.markdown(' &nbsp; '.join(badges), unsafe_allow_html=True)
+
+
+@st.fragment
 def display_dual_verification_results(result, text_images, image_images, user_image, reverse_result):
     """Display results for Text + Image verification with retrieved images"""
     st.markdown("---")
@@ -364,15 +666,7 @@ def display_dual_verification_results(result, text_images, image_images, user_im
     
     # Main verdict box
     verdict = result['verdict']
-    
-    if verdict == 'MATCH_AND_REAL':
-        css_class = 'real'
-    elif verdict == 'BOTH_REAL_DIFFERENT_INCIDENTS':
-        css_class = 'mismatch'
-    elif verdict == 'PARTIAL_FAKE':
-        css_class = 'fake'
-    else:
-        css_class = 'uncertain'
+    css_class = VERDICT_CSS_CLASSES.get(verdict, 'uncertain')
     
     st.markdown(
         f'<div class="result-box {css_class}">'
@@ -402,11 +696,13 @@ def display_dual_verification_results(result, text_images, image_images, user_im
                 f"{len(reverse_result['all_occurrences'])} different websites"
             )
         
-        # Show all occurrences
+        # Show all occurrences (one markdown block instead of two widgets each)
         with st.expander("📍 All websites where this image was found", expanded=False):
-            for i, occ in enumerate(reverse_result['all_occurrences'][:10]):
-                st.write(f"{i+1}. **{occ.get('domain', 'Unknown')}** - {occ.get('credibility', 'UNKNOWN')}")
-                st.caption(occ.get('snippet', occ.get('title', 'No description'))[:100])
+            st.markdown("\n".join(
+                f"{i+1}. **{occ.get('domain', 'Unknown')}** - {occ.get('credibility', 'UNKNOWN')}  \n"
+                f"   {occ.get('snippet', occ.get('title', 'No description'))[:100]}"
+                for i, occ in enumerate(reverse_result['all_occurrences'][:10])
+            ))
     
     # Show detailed analysis
     st.markdown("---")
@@ -439,26 +735,15 @@ def display_dual_verification_results(result, text_images, image_images, user_im
             st.subheader("📝 Images Retrieved Based on Text Description")
             st.caption("These images were found online matching your text description")
             
-            cols = st.columns(4)
-            for i, img_data in enumerate(text_images[:8]):
-                with cols[i % 4]:
-                    st.image(img_data['image'], use_column_width=True)
-                    
-                    # Show credibility badge
-                    credibility = img_data.get('credibility', 'UNKNOWN')
-                    badge_class = {
-                        'TIER1_GLOBAL': 'tier1',
-                        'TIER2_INDIA': 'tier2',
-                        'TIER3_REGIONAL': 'tier3',
-                        'SOCIAL_MEDIA': 'regional'
-                    }.get(credibility, 'tier3')
-                    
-                    st.markdown(
-                        f"**{img_data.get('source', 'Unknown')[:30]}** "
-                        f'<span class="credibility-badge {badge_class}">{credibility}</span>',
-                        unsafe_allow_html=True
-                    )
-                    st.caption(f"{img_data.get('name', '')[:40]}...")
+            shown = text_images[:8]
+            display_image_grid(
+                shown,
+                captions=[
+                    f"{img_data.get('source', 'Unknown')[:30]} — {img_data.get('name', '')[:40]}"
+                    for img_data in shown
+                ],
+                badge_classes=TEXT_BADGE_CLASSES
+            )
         
         # Show image-based images if image is real
         if image_is_real and image_images:
@@ -466,30 +751,19 @@ def display_dual_verification_results(result, text_images, image_images, user_im
             st.subheader("🖼️ Similar Images Found Online")
             st.caption("These similar images were found matching your uploaded image")
             
-            cols = st.columns(4)
-            for i, img_data in enumerate(image_images[:8]):
-                with cols[i % 4]:
-                    st.image(img_data['image'], use_column_width=True)
-                    
-                    # Show credibility
-                    credibility = img_data.get('credibility', 'UNKNOWN')
-                    badge_class = {
-                        'TIER1_GLOBAL': 'tier1',
-                        'TIER2_INDIA': 'tier2',
-                        'TIER3_REGIONAL': 'tier3'
-                    }.get(credibility, 'tier3')
-                    
-                    st.markdown(
-                        f"**{img_data.get('source', 'Unknown')[:30]}** "
-                        f'<span class="credibility-badge {badge_class}">{credibility}</span>',
-                        unsafe_allow_html=True
-                    )
+            shown = image_images[:8]
+            display_image_grid(
+                shown,
+                captions=[img_data.get('source', 'Unknown')[:30] for img_data in shown],
+                badge_classes=SIMILAR_BADGE_CLASSES
+            )
         
         st.success("✅ Above images from news sources verify the incident authenticity")
     else:
         st.warning("⚠️ No original images retrieved - both text and image appear to be fabricated")
 
 
+@st.fragment
 def display_text_only_results(result, retrieved_images):
     """Display results for text-only verification"""
     st.markdown("---")
@@ -508,16 +782,17 @@ def display_text_only_results(result, retrieved_images):
     
     if result['is_real'] and retrieved_images:
         st.subheader("🖼️ Retrieved Images from Web")
-        cols = st.columns(4)
-        for i, img_data in enumerate(retrieved_images[:8]):
-            with cols[i % 4]:
-                st.image(img_data['image'], use_column_width=True)
-                
-                # Show credibility
-                credibility = img_data.get('credibility', 'UNKNOWN')
-                st.caption(f"**{img_data.get('source', 'Unknown')[:30]}** ({credibility})")
+        shown = retrieved_images[:8]
+        display_image_grid(
+            shown,
+            captions=[
+                f"{img_data.get('source', 'Unknown')[:30]} ({img_data.get('credibility', 'UNKNOWN')})"
+                for img_data in shown
+            ]
+        )
 
 
+@st.fragment
 def display_image_only_results(result, retrieved_images, user_image, reverse_result):
     """Display results for image-only verification"""
     st.markdown("---")
@@ -549,8 +824,18 @@ def display_image_only_results(result, retrieved_images, user_image, reverse_res
         cols = st.columns(4)
         for i, img_data in enumerate(retrieved_images[:8]):
             with cols[i % 4]:
-                st.write(f"**{img_data.get('source', 'Unknown')[:30]}**")
-                st.caption(f"Credibility: {img_data.get('credibility', 'UNKNOWN')}")
+                st.markdown(
+                    f"**{img_data.get('source', 'Unknown')[:30]}**  \n"
+                    f"Credibility: {img_data.get('credibility', 'UNKNOWN')}"
+                )
+
+
+# Input mode of a stored result -> its display fragment
+RESULT_DISPLAYS = {
+    'dual': display_dual_verification_results,
+    'text': display_text_only_results,
+    'image': display_image_only_results
+}
 
 
 if __name__ == "__main__":
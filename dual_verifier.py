@@ -5,10 +5,354 @@ Better analysis and matching between text and images
 
 from PIL import Image
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Callable, Tuple
 import re
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 
+# Default size at which images are compared as pixel vectors
+SIMILARITY_SIZE = (100, 100)
+
+# Candidates compared per batch when an early exit is possible
+SIMILARITY_CHUNK_SIZE = 4
+
+# Side of the difference hash (DHASH_SIZE**2 bits)
+DHASH_SIZE = 8
+
+# Only this many retrieved images, the nearest by dHash, get the full pixel
+# correlation
+DHASH_PREFILTER_K = 16
+
+# Image sources counted as credible, matched as one pattern
+CREDIBLE_SOURCES = ['news', 'reuters', 'bbc', 'cnn', 'hindu', 'ndtv']
+CREDIBLE_SOURCE_PATTERN = re.compile('|'.join(map(re.escape, CREDIBLE_SOURCES)), re.IGNORECASE)
+
+# Keyword extraction patterns, compiled once
+NONWORD_PATTERN = re.compile(r'[^\w]')
+KEYWORD_DATE_PATTERNS = [
+    re.compile(r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\b'),
+    re.compile(r'\b(20\d{2})\b'),  # Years
+    re.compile(r'\b(today|yesterday|recent)\b')
+]
+
+
+# Pixel vectors of downloaded images, keyed by (image URL, size): repeated
+# and overlapping queries return many of the same hits. About 120 KB per
+# entry, so ~30 MB at the default; DUAL_PRP_VECTOR_CACHE_SIZE overrides it
+# (0 disables the in-memory cache).
+VECTOR_CACHE_SIZE = int(os.environ.get('DUAL_PRP_VECTOR_CACHE_SIZE', 256))
+_vector_cache = OrderedDict()
+_vector_cache_lock = threading.Lock()
+
+# Optional on-disk copy of the vector cache, so restarts skip re-encoding
+# images already seen; enabled by pointing DUAL_PRP_VECTOR_CACHE at a
+# directory. Roughly 120 KB per entry at the default size.
+VECTOR_CACHE_DIR = os.environ.get('DUAL_PRP_VECTOR_CACHE')
+VECTOR_CACHE_DISK_ENTRIES = 4096
+VECTOR_CACHE_PRUNE_EVERY = 100
+_disk_writes = 0
+
+
+def pixel_vector(img: Image.Image, size=SIMILARITY_SIZE) -> Optional[np.ndarray]:
+    """
+    Zero-mean, unit-length float32 pixel vector of the resized image, or None
+    if the image cannot be processed
+    
+    The dot product of two vectors is the Pearson correlation of the resized
+    images. float32 is plenty for 8-bit pixels and halves memory.
+    """
+    if not isinstance(img, Image.Image):
+        return None  # Missing image (e.g. failed download)
+    
+    try:
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # BOX (area average) is the cheapest filter that still uses every
+        # source pixel, which is all a coarse similarity needs
+        vector = np.asarray(img.resize(size, Image.Resampling.BOX), dtype=np.float32).ravel()
+    except (OSError, ValueError):
+        return None  # Truncated/corrupt data or an unsupported mode
+    
+    vector -= vector.mean()
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector  # Flat image stays all zero: zero correlation (similarity 0.5)
+
+
+def cached_pixel_vector(key: Optional[str], img: Image.Image, size=SIMILARITY_SIZE) -> Optional[np.ndarray]:
+    """pixel_vector, reused from the LRU cache when the image has a key"""
+    if not key:
+        return pixel_vector(img, size)
+    
+    cache_key = (key, size)
+    with _vector_cache_lock:
+        vector = _vector_cache.get(cache_key)
+        if vector is not None:
+            _vector_cache.move_to_end(cache_key)
+            return vector
+    
+    vector = load_disk_vector(cache_key)
+    if vector is None:
+        vector = pixel_vector(img, size)
+        if vector is not None:
+            store_disk_vector(cache_key, vector)
+    
+    if vector is not None:
+        with _vector_cache_lock:
+            _vector_cache[cache_key] = vector
+            while len(_vector_cache) > VECTOR_CACHE_SIZE:
+                _vector_cache.popitem(last=False)
+    return vector
+
+
+def _disk_vector_path(cache_key) -> str:
+    """File of a cached vector: SHA-1 of size and URL"""
+    url, size = cache_key
+    name = hashlib.sha1(f"{size[0]}x{size[1]} {url}".encode('utf-8')).hexdigest()
+    return os.path.join(VECTOR_CACHE_DIR, name + '.npy')
+
+
+def load_disk_vector(cache_key) -> Optional[np.ndarray]:
+    """Vector from the on-disk cache, or None (also when it is disabled)"""
+    if not VECTOR_CACHE_DIR:
+        return None
+    
+    path = _disk_vector_path(cache_key)
+    try:
+        vector = np.load(path)
+        os.utime(path)  # Recently used: pruned last
+        return vector
+    except (OSError, ValueError):
+        return None
+
+
+def store_disk_vector(cache_key, vector: np.ndarray):
+    """Write a vector to the on-disk cache (no-op when it is disabled)"""
+    global _disk_writes
+    
+    if not VECTOR_CACHE_DIR:
+        return
+    
+    path = _disk_vector_path(cache_key)
+    try:
+        os.makedirs(VECTOR_CACHE_DIR, exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, vector)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Vector cache write error: {e}")
+        return
+    
+    _disk_writes += 1
+    if _disk_writes % VECTOR_CACHE_PRUNE_EVERY == 0:
+        prune_disk_vectors()
+
+
+def prune_disk_vectors():
+    """Delete the least recently used files beyond VECTOR_CACHE_DISK_ENTRIES"""
+    try:
+        entries = [
+            entry for entry in os.scandir(VECTOR_CACHE_DIR)
+            if entry.name.endswith('.npy')
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:-VECTOR_CACHE_DISK_ENTRIES]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"Vector cache prune error: {e}")
+
+
+def encode_images(
+    images: List[Image.Image],
+    size=SIMILARITY_SIZE,
+    keys: List[Optional[str]] = None
+) -> np.ndarray:
+    """
+    Encode images as rows of pixel_vector; images that cannot be processed
+    are skipped
+    
+    keys (e.g. image URLs) enable the cross-call vector cache. Within a call
+    an image object repeated in the list is encoded only once.
+    """
+    if keys is None:
+        keys = [None] * len(images)
+    
+    by_identity = {}
+    vectors = []
+    for img, key in zip(images, keys):
+        if id(img) not in by_identity:
+            by_identity[id(img)] = cached_pixel_vector(key, img, size)
+        if by_identity[id(img)] is not None:
+            vectors.append(by_identity[id(img)])
+    
+    if not vectors:
+        return np.empty((0, size[0] * size[1] * 3), dtype=np.float32)
+    
+    return np.stack(vectors)
+
+
+def batch_image_similarity(
+    user_image: Image.Image,
+    images: List[Image.Image],
+    size=SIMILARITY_SIZE,
+    keys: List[Optional[str]] = None
+) -> np.ndarray:
+    """
+    Similarity (0 to 1) of the user image to every image, computed with one
+    matrix product over all candidates
+    """
+    candidates = encode_images(images, size, keys)
+    user_vector = pixel_vector(user_image, size)
+    
+    if user_vector is None:
+        return np.full(len(candidates), 0.5, dtype=np.float32)  # Default middle value
+    
+    correlations = candidates @ user_vector
+    return np.clip((correlations + 1) / 2, 0, 1)
+
+
+def dhash(img: Image.Image, hash_size: int = DHASH_SIZE) -> Optional[np.ndarray]:
+    """
+    Difference hash: whether each pixel of a (hash_size+1) x hash_size
+    grayscale thumbnail is brighter than its right neighbour, packed into
+    hash_size*hash_size bits (8 bytes by default). None if the image cannot
+    be processed.
+    """
+    if not isinstance(img, Image.Image):
+        return None
+    
+    try:
+        gray = img.convert('L').resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    except (OSError, ValueError):
+        return None
+    
+    pixels = np.asarray(gray, dtype=np.int16)
+    
+    return np.packbits(pixels[:, 1:] > pixels[:, :-1])
+
+
+def batch_dhash_similarity(
+    user_image: Image.Image,
+    images: List[Image.Image],
+    hash_size: int = DHASH_SIZE
+) -> np.ndarray:
+    """
+    Similarity (0 to 1) of the user image to every image as 1 - Hamming
+    distance / bits between their dHashes
+    
+    Far cheaper than pixel correlation and robust to rescaling and
+    recompression, so suited to spotting copies of the same picture.
+    """
+    hashes = [h for h in (dhash(img, hash_size) for img in images) if h is not None]
+    user_hash = dhash(user_image, hash_size)
+    
+    if user_hash is None or not hashes:
+        return np.full(len(hashes), 0.5, dtype=np.float32)  # Default middle value
+    
+    distances = np.unpackbits(np.stack(hashes) ^ user_hash, axis=1).sum(axis=1)
+    return 1 - distances.astype(np.float32) / (hash_size * hash_size)
+
+
+def nearest_by_dhash(
+    user_image: Image.Image,
+    similar_images: List[Dict],
+    k: int = DHASH_PREFILTER_K
+) -> List[Dict]:
+    """
+    The k retrieved image dicts whose dHash is nearest the user image's, in
+    their original order (all of them if there are k or fewer)
+    
+    Uses the 'dhash' stored by the retriever, hashing images without one.
+    Images that cannot be hashed rank last.
+    """
+    if len(similar_images) <= k:
+        return similar_images
+    
+    user_hash = dhash(user_image)
+    if user_hash is None:
+        return similar_images[:k]
+    
+    hashes = []
+    for img_data in similar_images:
+        image_hash = img_data.get('dhash')
+        if image_hash is None:
+            image_hash = dhash(img_data.get('image'))
+        hashes.append(~user_hash if image_hash is None else image_hash)
+    
+    distances = np.unpackbits(np.stack(hashes) ^ user_hash, axis=1).sum(axis=1)
+    nearest = np.argsort(distances, kind='stable')[:k]
+    return [similar_images[i] for i in sorted(nearest)]
+
+
+def candidate_keys(user_image: Image.Image, similar_images: List[Dict]) -> List[Optional[str]]:
+    """
+    Vector cache keys (image URLs) for retrieved images
+    
+    Reverse search placeholders carry the user image under a page URL, so
+    they get no key and are never cached.
+    """
+    return [
+        None if img_data.get('image') is user_image else img_data.get('url')
+        for img_data in similar_images
+    ]
+
+
+def image_similarity(img1: Image.Image, img2: Image.Image, size=SIMILARITY_SIZE) -> float:
+    """Similarity (0 to 1) between two images"""
+    similarities = batch_image_similarity(img1, [img2], size)
+    return float(similarities[0]) if len(similarities) else 0.5
+
+
+def average_image_similarity(
+    user_image: Image.Image,
+    similar_images: List[Dict],
+    size=SIMILARITY_SIZE,
+    saturated: Callable[[float], bool] = None
+) -> Tuple[float, bool]:
+    """
+    Mean similarity (0 to 1) of the user image to retrieved image dicts,
+    0 if none of them could be compared, and whether every candidate was
+    compared
+    
+    Of many candidates only the DHASH_PREFILTER_K nearest by dHash are
+    compared (see nearest_by_dhash).
+    
+    With saturated, images are compared SIMILARITY_CHUNK_SIZE at a time and
+    comparison stops once saturated(lowest average the rest could give) is
+    True; the mean is then over the images compared so far only (partial).
+    """
+    similar_images = nearest_by_dhash(user_image, similar_images)
+    chunk_size = SIMILARITY_CHUNK_SIZE if saturated else max(len(similar_images), 1)
+    total = 0.0
+    count = 0
+    complete = True
+    
+    for start in range(0, len(similar_images), chunk_size):
+        chunk = similar_images[start:start + chunk_size]
+        similarity_scores = batch_image_similarity(
+            user_image,
+            [img_data.get('image') for img_data in chunk],
+            size,
+            candidate_keys(user_image, chunk)
+        )
+        total += float(similarity_scores.sum())
+        count += len(similarity_scores)
+        
+        remaining = len(similar_images) - start - len(chunk)
+        if saturated and remaining and count and saturated(total / (count + remaining)):
+            complete = False
+            break
+    
+    return (total / count if count else 0), complete
+
+
 class DualVerifierEnhanced:
     """
     Enhanced Dual Verifier with:
@@ -26,6 +370,9 @@ class DualVerifierEnhanced:
         self.high_confidence_threshold = 70
         self.medium_confidence_threshold = 50
         
+        # Images are compared as pixel vectors at this size
+        self.similarity_size = SIMILARITY_SIZE
+        
         # Common event keywords
         self.event_keywords = {
             'fire': ['fire', 'burning', 'smoke', 'flames', 'blaze'],
@@ -35,6 +382,29 @@ class DualVerifierEnhanced:
             'protest': ['protest', 'rally', 'demonstration'],
             'violence': ['violence', 'attack', 'shooting']
         }
+        
+        # All event words in one pattern, scanned in a single pass. The
+        # lookahead reports a match at every position (longest word first);
+        # shorter words inside a match are added via event_word_hits.
+        event_words = sorted(
+            {w for words in self.event_keywords.values() for w in words},
+            key=len, reverse=True
+        )
+        self.event_word_pattern = re.compile(
+            '(?=(' + '|'.join(map(re.escape, event_words)) + '))'
+        )
+        self.event_word_hits = {}
+        for matched in event_words:
+            hits = {w for w in event_words if w in matched}
+            hits.update(
+                event_type for event_type, words in self.event_keywords.items()
+                if hits.intersection(words)
+            )
+            self.event_word_hits[matched] = hits
+        
+        # Keyword extraction is pure, so a repeated text (text-only and dual
+        # checks, retries) reuses the result; the tuple is copied per call
+        self._keywords_cache = lru_cache(maxsize=512)(self._compute_keywords)
     
     def verify_text_and_image(
         self, 
@@ -145,36 +515,33 @@ class DualVerifierEnhanced:
     
     def _extract_keywords(self, text: str) -> List[str]:
         """
-        Extract important keywords from text
+        Extract important keywords from text (cached per text)
+        """
+        return list(self._keywords_cache(text))
+    
+    def _compute_keywords(self, text: str) -> Tuple[str, ...]:
+        """
+        Keyword extraction behind _extract_keywords
         """
         text_lower = text.lower()
         keywords = []
         
-        # Extract event types
-        for event_type, words in self.event_keywords.items():
-            if any(word in text_lower for word in words):
-                keywords.append(event_type)
-                keywords.extend([w for w in words if w in text_lower])
+        # Extract event types (and the event words that matched)
+        for match in self.event_word_pattern.finditer(text_lower):
+            keywords.extend(self.event_word_hits[match.group(1)])
         
         # Extract locations (capitalized words)
         words = text.split()
         for word in words:
-            clean = re.sub(r'[^\w]', '', word)
+            clean = NONWORD_PATTERN.sub('', word)
             if clean and len(clean) > 2 and clean[0].isupper() and clean not in keywords:
                 keywords.append(clean.lower())
         
         # Extract dates
-        date_patterns = [
-            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\b',
-            r'\b(20\d{2})\b',  # Years
-            r'\b(today|yesterday|recent)\b'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_lower)
-            keywords.extend(matches)
+        for pattern in KEYWORD_DATE_PATTERNS:
+            keywords.extend(pattern.findall(text_lower))
         
-        return list(set(keywords))  # Remove duplicates
+        return tuple(set(keywords))  # Remove duplicates
     
     def _verify_text_with_images_enhanced(
         self, 
@@ -202,24 +569,28 @@ class DualVerifierEnhanced:
         keywords_matched = []
         keyword_score = 0
         
-        for img in images:
-            img_source = img.get('source', '').lower()
-            img_name = img.get('name', '').lower()
-            img_text = f"{img_source} {img_name}"
-            
-            for keyword in keywords:
-                if keyword in img_text:
-                    keywords_matched.append(keyword)
-                    keyword_score += 5
+        # Lowercase every source once for both the keyword and credibility scans
+        img_sources = [img.get('source', '').lower() for img in images]
+        
+        img_texts = [
+            f"{img_source} {img.get('name', '').lower()}"
+            for img, img_source in zip(images, img_sources)
+        ]
+        
+        # 5 points per image mentioning each keyword
+        for keyword in keywords:
+            hits = sum(1 for img_text in img_texts if keyword in img_text)
+            if hits:
+                keywords_matched.append(keyword)
+                keyword_score += 5 * hits
         
         keywords_matched = list(set(keywords_matched))
         keyword_match_ratio = len(keywords_matched) / max(len(keywords), 1)
         
         # Credibility boost
-        credible_sources = ['news', 'reuters', 'bbc', 'cnn', 'hindu', 'ndtv']
         credible_count = sum(
-            1 for img in images 
-            if any(source in img.get('source', '').lower() for source in credible_sources)
+            1 for img_source in img_sources
+            if CREDIBLE_SOURCE_PATTERN.search(img_source)
         )
         credibility_score = min(credible_count * 8, 30)
         
@@ -276,28 +647,18 @@ class DualVerifierEnhanced:
                 'similarity_score': 0
             }
         
-        # Calculate similarity scores
-        similarity_scores = []
-        for img_data in similar_images:
-            try:
-                similarity = self._calculate_image_similarity(
-                    user_image, 
-                    img_data['image']
-                )
-                similarity_scores.append(similarity)
-            except:
-                continue
-        
-        if not similarity_scores:
-            avg_similarity = 0
-        else:
-            avg_similarity = sum(similarity_scores) / len(similarity_scores)
-        
         # Confidence based on similarity and count
-        confidence = min(
-            int(avg_similarity * 60) + len(similar_images) * 5 + 20,
-            95
+        def image_confidence(avg_similarity):
+            return min(int(avg_similarity * 60) + len(similar_images) * 5 + 20, 95)
+        
+        # Stop comparing once confidence is capped whatever the rest score
+        avg_similarity, complete = average_image_similarity(
+            user_image,
+            similar_images,
+            self.similarity_size,
+            saturated=lambda lowest: image_confidence(lowest) >= 95
         )
+        confidence = image_confidence(avg_similarity)
         
         if confidence >= 70:
             is_real = True
@@ -317,26 +678,14 @@ class DualVerifierEnhanced:
             'authenticity': authenticity,
             'confidence': confidence,
             'explanation': explanation,
-            'similarity_score': avg_similarity
+            'similarity_score': avg_similarity,
+            # After an early stop the score covers only the images compared
+            'similarity_partial': not complete
         }
     
     def _calculate_image_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
         """Calculate similarity between two images"""
-        try:
-            size = (100, 100)
-            img1_resized = img1.resize(size)
-            img2_resized = img2.resize(size)
-            
-            arr1 = np.array(img1_resized).flatten()
-            arr2 = np.array(img2_resized).flatten()
-            
-            correlation = np.corrcoef(arr1, arr2)[0, 1]
-            similarity = (correlation + 1) / 2
-            
-            return max(0, min(1, similarity))
-        
-        except:
-            return 0.5
+        return image_similarity(img1, img2, self.similarity_size)
     
     def _check_consistency_enhanced(
         self,
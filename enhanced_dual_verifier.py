@@ -10,14 +10,26 @@ This is the MAIN ENHANCEMENT over base DEETSA paper
 """
 
 from PIL import Image
-import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
+import logging
+import requests
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our new modules
 from temporal_verifier import TemporalVerifier
 from evidence_aggregator import EvidenceAggregator
 from multimodal_fusion import AttentionFusion
+from dual_verifier import image_similarity, average_image_similarity
+
+# Per-step progress goes to debug level (off unless logging is configured
+# for it); errors are logged at error level
+logger = logging.getLogger(__name__)
+
+# Image sources counted as credible, matched as one pattern
+CREDIBLE_SOURCES = ['news', 'government', 'official', 'reuters', 'bbc', 'cnn']
+CREDIBLE_SOURCE_PATTERN = re.compile('|'.join(map(re.escape, CREDIBLE_SOURCES)), re.IGNORECASE)
 
 class EnhancedDualVerifier:
     """
@@ -35,15 +47,21 @@ class EnhancedDualVerifier:
         """Initialize enhanced verifier with all modules"""
         print("Initializing Enhanced Dual Verifier...")
         
-        # Initialize our novel modules
+        # Initialize our novel modules (evidence requests share one session)
+        self.http_session = requests.Session()
         self.temporal_verifier = TemporalVerifier()
-        self.evidence_aggregator = EvidenceAggregator()
+        self.evidence_aggregator = EvidenceAggregator(session=self.http_session)
         self.attention_fusion = AttentionFusion()
         
         # Confidence thresholds
         self.high_confidence_threshold = 70
         self.medium_confidence_threshold = 50
         
+        # A fact-check of (nearly) this exact claim with one of these ratings
+        # decides the verdict on its own
+        self.factcheck_match_threshold = 0.9
+        self.decisive_ratings = {'true', 'false', 'misleading'}
+        
         print("✓ Enhanced Dual Verifier initialized with ALL enhancements!")
     
     def verify_text_and_image(
@@ -64,44 +82,63 @@ class EnhancedDualVerifier:
         4. Contradiction detection
         """
         try:
-            print("\n" + "="*60)
-            print("ENHANCED VERIFICATION PROCESS")
-            print("="*60)
-            
-            # STEP 1: Basic text and image verification (existing)
-            print("\n[1/5] Basic verification...")
-            text_result = self._verify_text_with_images(text, text_based_images)
-            image_result = self._verify_image_with_images(user_image, image_based_images)
-            
-            # STEP 2: NOVEL - Temporal Verification
-            print("[2/5] Temporal verification (NEW)...")
-            temporal_result = self.temporal_verifier.verify_temporal_consistency(
-                text, 
-                user_image
-            )
+            logger.debug("ENHANCED VERIFICATION PROCESS")
             
-            if temporal_result['has_mismatch']:
-                print(f"  ⚠️ Temporal mismatch detected: {temporal_result['severity']}")
-            else:
-                print("  ✓ No temporal inconsistencies")
+            # A fact-checker that already rated this exact claim settles it:
+            # skip image comparison, EXIF, evidence scraping and fusion
+            factchecks = self.evidence_aggregator.get_factcheck_evidence(text)
+            decisive_factcheck = self._find_decisive_factcheck(text, factchecks)
+            if decisive_factcheck:
+                logger.debug(
+                    "  ✓ Claim already fact-checked: %s (%s)",
+                    decisive_factcheck['rating'], decisive_factcheck['publisher']
+                )
+                return self._build_factcheck_result(decisive_factcheck, factchecks)
             
-            # STEP 3: NOVEL - Multi-source Evidence Aggregation
-            print("[3/5] Aggregating external evidence (NEW)...")
-            keywords = text_info.get('keywords', []) if text_info else text.split()[:10]
-            location = text_info.get('location') if text_info else None
+            # External evidence (news, fact-check, Wikipedia over HTTP) and
+            # the temporal check (EXIF plus a web search for the event date)
+            # are independent of step 1, so both run in the background while
+            # the local image comparison does
+            keywords, location = self._evidence_query(text, text_info)
             
-            external_evidence = self.evidence_aggregator.aggregate_all_evidence(
-                text,
-                keywords,
-                location
-            )
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                evidence_future = executor.submit(
+                    self.evidence_aggregator.aggregate_all_evidence,
+                    text,
+                    keywords,
+                    location,
+                    factchecks
+                )
+                temporal_future = executor.submit(
+                    self.temporal_verifier.verify_temporal_consistency,
+                    text,
+                    user_image
+                )
+                
+                # STEP 1: Basic text and image verification (existing)
+                logger.debug("[1/5] Basic verification...")
+                text_result = self._verify_text_with_images(text, text_based_images)
+                image_result = self._verify_image_with_images(user_image, image_based_images)
+                
+                # STEP 2: NOVEL - Temporal Verification
+                logger.debug("[2/5] Temporal verification (NEW)...")
+                temporal_result = temporal_future.result()
+                
+                if temporal_result['has_mismatch']:
+                    logger.debug("  ⚠️ Temporal mismatch detected: %s", temporal_result['severity'])
+                else:
+                    logger.debug("  ✓ No temporal inconsistencies")
+                
+                # STEP 3: NOVEL - Multi-source Evidence Aggregation
+                logger.debug("[3/5] Aggregating external evidence (NEW)...")
+                external_evidence = evidence_future.result()
             
             summary = external_evidence['summary']
-            print(f"  ✓ Evidence aggregated: {summary['total_sources']} sources")
-            print(f"  ✓ Evidence score: {summary['evidence_score']}/100")
+            logger.debug("  ✓ Evidence aggregated: %s sources", summary['total_sources'])
+            logger.debug("  ✓ Evidence score: %s/100", summary['evidence_score'])
             
             # STEP 4: NOVEL - Attention-based Fusion
-            print("[4/5] Fusing evidence with attention mechanism (NEW)...")
+            logger.debug("[4/5] Fusing evidence with attention mechanism (NEW)...")
             fused_result = self.attention_fusion.fuse_all_evidence(
                 text_result,
                 image_result,
@@ -109,10 +146,10 @@ class EnhancedDualVerifier:
                 external_evidence
             )
             
-            print(f"  ✓ Final authenticity score: {fused_result['authenticity_score']}/100")
+            logger.debug("  ✓ Final authenticity score: %s/100", fused_result['authenticity_score'])
             
             # STEP 5: Generate comprehensive result
-            print("[5/5] Generating final verdict...")
+            logger.debug("[5/5] Generating final verdict...")
             final_result = self._build_comprehensive_result(
                 fused_result,
                 text_result,
@@ -121,19 +158,68 @@ class EnhancedDualVerifier:
                 external_evidence
             )
             
-            print("="*60)
-            print(f"VERDICT: {final_result['verdict']}")
-            print(f"CONFIDENCE: {final_result['confidence']}%")
-            print("="*60 + "\n")
+            logger.debug(
+                "VERDICT: %s, CONFIDENCE: %s%%",
+                final_result['verdict'], final_result['confidence']
+            )
             
             return final_result
         
         except Exception as e:
-            print(f"Enhanced verification error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Enhanced verification error: %s", e, exc_info=True)
             return self._get_error_result()
     
+    def verify_batch(self, items: List[Dict], max_workers: int = 4) -> List[Dict]:
+        """
+        Verify several text + image claims concurrently
+        
+        Each item holds the verify_text_and_image arguments: 'text',
+        'user_image', 'text_based_images', 'image_based_images' and
+        optionally 'text_info'. All claims share this verifier's HTTP
+        session and evidence cache.
+        
+        Items are grouped by claim text (case and whitespace ignored): the
+        first item of each group runs in a first wave, the repeats in a
+        second one, by which time their evidence is cached. Run together,
+        the repeats would all miss the cache and fetch the same evidence.
+        
+        Returns results in the order of items
+        """
+        if not items:
+            return []
+        
+        first_wave, repeats = [], []
+        seen_texts = set()
+        for index, item in enumerate(items):
+            text_key = ' '.join(item['text'].lower().split())
+            if text_key in seen_texts:
+                repeats.append(index)
+            else:
+                seen_texts.add(text_key)
+                first_wave.append(index)
+        
+        results = [None] * len(items)
+        # One pool for both waves, sized for the larger one (a single claim
+        # repeated many times makes the second wave the wide one)
+        pool_size = min(max_workers, max(len(first_wave), len(repeats)))
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            for wave in (first_wave, repeats):
+                futures = {
+                    index: executor.submit(
+                        self.verify_text_and_image,
+                        items[index]['text'],
+                        items[index]['user_image'],
+                        items[index].get('text_based_images', []),
+                        items[index].get('image_based_images', []),
+                        items[index].get('text_info')
+                    )
+                    for index in wave
+                }
+                for index, future in futures.items():
+                    results[index] = future.result()
+        
+        return results
+    
     def verify_text_only(
         self, 
         text: str, 
@@ -144,17 +230,31 @@ class EnhancedDualVerifier:
         ENHANCED text-only verification with external evidence
         """
         try:
+            # A false fact-check rating overrides everything else, so fact-
+            # checks are queried first and the rest is skipped on a hit
+            factchecks = self.evidence_aggregator.get_factcheck_evidence(text)
+            for fc in factchecks:
+                if fc.get('rating', '').lower() in ['false', 'fake', 'misleading']:
+                    return {
+                        'is_real': False,
+                        'authenticity': 'FACT-CHECKED AS FALSE',
+                        'confidence': 95,
+                        'explanation': f"Fact-check by {fc.get('publisher')}: {fc.get('rating')}",
+                        'evidence_count': len(retrieved_images),
+                        'external_evidence': self._factcheck_evidence(factchecks)
+                    }
+            
             # Basic verification
             text_result = self._verify_text_with_images(text, retrieved_images)
             
             # External evidence
-            keywords = text_info.get('keywords', []) if text_info else text.split()[:10]
-            location = text_info.get('location') if text_info else None
+            keywords, location = self._evidence_query(text, text_info)
             
             external_evidence = self.evidence_aggregator.aggregate_all_evidence(
                 text,
                 keywords,
-                location
+                location,
+                factchecks
             )
             
             # Combine scores
@@ -164,21 +264,6 @@ class EnhancedDualVerifier:
             # Weighted average (60% basic, 40% external)
             final_confidence = int(basic_score * 0.6 + evidence_score * 0.4)
             
-            # Check fact-checks
-            factchecks = external_evidence.get('factcheck', [])
-            if factchecks:
-                # If fact-check says false, override
-                for fc in factchecks:
-                    if fc.get('rating', '').lower() in ['false', 'fake', 'misleading']:
-                        return {
-                            'is_real': False,
-                            'authenticity': 'FACT-CHECKED AS FALSE',
-                            'confidence': 95,
-                            'explanation': f"Fact-check by {fc.get('publisher')}: {fc.get('rating')}",
-                            'evidence_count': len(retrieved_images),
-                            'external_evidence': external_evidence
-                        }
-            
             return {
                 'is_real': text_result['is_real'],
                 'authenticity': text_result['authenticity'],
@@ -189,7 +274,7 @@ class EnhancedDualVerifier:
             }
         
         except Exception as e:
-            print(f"Text verification error: {e}")
+            logger.error("Text verification error: %s", e)
             return {
                 'is_real': False,
                 'authenticity': 'ERROR',
@@ -216,7 +301,6 @@ class EnhancedDualVerifier:
                 
                 if image_date:
                     # Check if image is very old
-                    from datetime import datetime
                     age_days = (datetime.now() - image_date).days
                     
                     if age_days > 365:
@@ -233,7 +317,7 @@ class EnhancedDualVerifier:
             }
         
         except Exception as e:
-            print(f"Image verification error: {e}")
+            logger.error("Image verification error: %s", e)
             return {
                 'is_real': False,
                 'authenticity': 'ERROR',
@@ -259,10 +343,9 @@ class EnhancedDualVerifier:
         evidence_score = min(len(images) * 10, 100)
         
         # Check if images are from credible sources
-        credible_sources = ['news', 'government', 'official', 'reuters', 'bbc', 'cnn']
         credible_count = sum(
-            1 for img in images 
-            if any(source in img.get('source', '').lower() for source in credible_sources)
+            1 for img in images
+            if CREDIBLE_SOURCE_PATTERN.search(img.get('source', ''))
         )
         
         credibility_boost = min(credible_count * 5, 20)
@@ -302,30 +385,26 @@ class EnhancedDualVerifier:
                 'similarity_score': 0
             }
         
-        # Calculate similarity score
-        similarity_scores = []
-        for img_data in similar_images:
-            try:
-                similarity = self._calculate_image_similarity(
-                    user_image, 
-                    img_data['image']
-                )
-                similarity_scores.append(similarity)
-            except:
-                continue
-        
-        if not similarity_scores:
-            avg_similarity = 0
-        else:
-            avg_similarity = sum(similarity_scores) / len(similarity_scores)
-        
         # Confidence based on similarity and count
-        confidence = min(int(avg_similarity * 100) + len(similar_images) * 5, 95)
+        def image_confidence(avg_similarity):
+            return min(int(avg_similarity * 100) + len(similar_images) * 5, 95)
+        
+        # Stop comparing once confidence is capped whatever the rest score
+        avg_similarity, complete = average_image_similarity(
+            user_image,
+            similar_images,
+            saturated=lambda lowest: image_confidence(lowest) >= 95
+        )
+        confidence = image_confidence(avg_similarity)
         
         if confidence >= self.high_confidence_threshold:
             is_real = True
             authenticity = 'REAL'
-            explanation = f'Found {len(similar_images)} similar images online with {avg_similarity:.1%} similarity. Image appears authentic.'
+            if complete:
+                explanation = f'Found {len(similar_images)} similar images online with {avg_similarity:.1%} similarity. Image appears authentic.'
+            else:
+                # Comparison stopped early: the mean is not over all images
+                explanation = f'Found {len(similar_images)} similar images online. Image appears authentic.'
         elif confidence >= self.medium_confidence_threshold:
             is_real = True
             authenticity = 'LIKELY REAL'
@@ -340,31 +419,14 @@ class EnhancedDualVerifier:
             'authenticity': authenticity,
             'confidence': confidence,
             'explanation': explanation,
-            'similarity_score': avg_similarity
+            'similarity_score': avg_similarity,
+            # After an early stop the score covers only the images compared
+            'similarity_partial': not complete
         }
     
     def _calculate_image_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
         """Calculate basic similarity between two images"""
-        try:
-            # Resize to same size for comparison
-            size = (100, 100)
-            img1_resized = img1.resize(size)
-            img2_resized = img2.resize(size)
-            
-            # Convert to numpy arrays
-            arr1 = np.array(img1_resized).flatten()
-            arr2 = np.array(img2_resized).flatten()
-            
-            # Calculate correlation
-            correlation = np.corrcoef(arr1, arr2)[0, 1]
-            
-            # Convert to similarity (0 to 1)
-            similarity = (correlation + 1) / 2
-            
-            return max(0, min(1, similarity))
-        
-        except Exception as e:
-            return 0.5  # Default middle value
+        return image_similarity(img1, img2)
     
     def _build_comprehensive_result(
         self,
@@ -418,9 +480,100 @@ class EnhancedDualVerifier:
             }
         
         except Exception as e:
-            print(f"Result building error: {e}")
+            logger.error("Result building error: %s", e)
             return self._get_error_result()
     
+    def _evidence_query(self, text: str, text_info: Dict = None) -> Tuple[List[str], Optional[str]]:
+        """
+        Keywords and location for the evidence search: from the processed
+        text_info, else the first 10 words of the text
+        """
+        if text_info:
+            return text_info.get('keywords', []), text_info.get('location')
+        
+        # maxsplit stops splitting after the words that are used
+        return text.split(maxsplit=10)[:10], None
+    
+    def _find_decisive_factcheck(self, text: str, factchecks: List[Dict]) -> Dict:
+        """
+        Return the fact-check that rates this same claim with a clear
+        true/false/misleading rating, or None
+        """
+        claim_words = set(re.findall(r'\w+', text.lower()))
+        if not claim_words:
+            return None
+        
+        for fc in factchecks:
+            rating = fc.get('rating', '').lower().strip(' .')
+            if rating not in self.decisive_ratings:
+                continue
+            
+            fc_words = set(re.findall(r'\w+', fc.get('claim', '').lower()))
+            similarity = len(claim_words & fc_words) / len(claim_words | fc_words)
+            if similarity >= self.factcheck_match_threshold:
+                return fc
+        
+        return None
+    
+    def _build_factcheck_result(self, factcheck: Dict, factchecks: List[Dict]) -> Dict:
+        """
+        Build the result for a claim decided by an existing fact-check
+        """
+        is_real = factcheck['rating'].lower().strip(' .') == 'true'
+        auth_score = self.attention_fusion._compute_factcheck_score([factcheck])
+        
+        if is_real:
+            verdict = 'VERIFIED_AUTHENTIC'
+            main_message = '✅ VERIFIED AS AUTHENTIC'
+            contradictions = []
+        else:
+            verdict = 'CRITICAL_CONTRADICTIONS'
+            main_message = '🚨 CRITICAL CONTRADICTIONS DETECTED'
+            contradictions = [{
+                'type': 'FACTCHECK_CONTRADICTION',
+                'severity': 'HIGH',
+                'description': f"Fact-check rated as '{factcheck['rating']}' by {factcheck['publisher']}",
+                'confidence': 95
+            }]
+        
+        explanation = (
+            f"This claim was already fact-checked by {factcheck['publisher']} "
+            f"and rated '{factcheck['rating']}'."
+        )
+        if factcheck.get('url'):
+            explanation += f"\nSource: {factcheck['url']}"
+        
+        skipped = {
+            'is_real': is_real,
+            'authenticity': 'SKIPPED',
+            'confidence': 0,
+            'explanation': 'Not needed - decided by fact-check'
+        }
+        
+        return {
+            'verdict': verdict,
+            'main_message': main_message,
+            'confidence': 95,
+            'explanation': explanation,
+            'text_verification': skipped,
+            'image_verification': skipped,
+            'temporal_verification': {'has_mismatch': False, 'confidence': 0},
+            'external_evidence': self._factcheck_evidence(factchecks),
+            'attention_weights': {'factcheck': 1.0},
+            'contradictions': contradictions,
+            'authenticity_score': auth_score
+        }
+    
+    def _factcheck_evidence(self, factchecks: List[Dict]) -> Dict:
+        """
+        External evidence holding only the fact-checks, in the same shape as
+        aggregate_all_evidence returns (empty sources, computed summary)
+        """
+        evidence = self.evidence_aggregator._get_empty_evidence()
+        evidence['factcheck'] = factchecks
+        evidence['summary'] = self.evidence_aggregator._compute_evidence_summary(evidence)
+        return evidence
+    
     def _get_error_result(self) -> Dict:
         """Return error result"""
         return {
@@ -16,6 +16,10 @@ from bs4 import BeautifulSoup
 import json
 from typing import Dict, List, Optional
 import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 
 class EvidenceAggregator:
@@ -34,10 +38,20 @@ class EvidenceAggregator:
     - Broader coverage than static KB
     """
     
-    def __init__(self):
-        """Initialize evidence aggregator"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize evidence aggregator
+        
+        Args:
+            session: Optional requests.Session to share keep-alive
+                     connections with other components
+        """
         print("✓ Multi-Source Evidence Aggregator initialized")
         
+        # All requests go through one session so repeated hosts (Google,
+        # Wikipedia, fact-check API) reuse their connections
+        self.session = session or requests.Session()
+        
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -50,16 +64,28 @@ class EvidenceAggregator:
             'web_scraping': 0.60,   # Moderate credibility
             'social_media': 0.40    # Lower credibility
         }
+        
+        # Recently aggregated evidence, keyed by claim fingerprint, so
+        # re-verifying the same claim skips all outbound requests
+        self.cache_ttl = 300  # seconds
+        self.cache_max_entries = 256
+        self._evidence_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def aggregate_all_evidence(
         self, 
         text: str, 
         keywords: List[str],
-        location: Optional[str] = None
+        location: Optional[str] = None,
+        factchecks: Optional[List[Dict]] = None
     ) -> Dict:
         """
         Aggregate evidence from ALL sources
         
+        Args:
+            factchecks: Fact-check results the caller already fetched with
+                        get_factcheck_evidence (not queried again)
+        
         Returns comprehensive evidence dictionary:
         {
             'news': [...],
@@ -70,29 +96,51 @@ class EvidenceAggregator:
         }
         """
         try:
+            cache_key = self._claim_fingerprint(text, keywords, location)
+            cached = self._get_cached_evidence(cache_key)
+            if cached is not None:
+                print("✓ Using cached evidence for this claim")
+                return cached
+            
             print(f"🔍 Aggregating evidence from multiple sources...")
             
             evidence = {}
             
-            # 1. Get news evidence
-            print("  📰 Fetching news articles...")
-            evidence['news'] = self.get_news_evidence(text, keywords, location)
-            
-            # 2. Get fact-check evidence
-            print("  ✅ Querying fact-check APIs...")
-            evidence['factcheck'] = self.get_factcheck_evidence(text)
-            
-            # 3. Get Wikipedia data
-            print("  📚 Searching Wikipedia...")
-            evidence['wikipedia'] = self.get_wikipedia_evidence(keywords, location)
-            
-            # 4. Get general web evidence (existing scraping enhanced)
-            print("  🌐 Web scraping for additional evidence...")
-            evidence['web_general'] = self.get_web_evidence(text, keywords)
+            # The sources are independent HTTP lookups, so they are fetched
+            # concurrently: total latency is the slowest source, not the sum
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                # 1. Get news evidence
+                print("  📰 Fetching news articles...")
+                news_future = executor.submit(self.get_news_evidence, text, keywords, location)
+                
+                # 2. Get fact-check evidence
+                factcheck_future = None
+                if factchecks is None:
+                    print("  ✅ Querying fact-check APIs...")
+                    factcheck_future = executor.submit(self.get_factcheck_evidence, text)
+                
+                # 3. Get Wikipedia data
+                print("  📚 Searching Wikipedia...")
+                wikipedia_future = executor.submit(self.get_wikipedia_evidence, keywords, location)
+                
+                # 4. Get general web evidence (existing scraping enhanced)
+                print("  🌐 Web scraping for additional evidence...")
+                web_future = executor.submit(self.get_web_evidence, text, keywords)
+                
+                evidence['news'] = news_future.result()
+                evidence['factcheck'] = factcheck_future.result() if factcheck_future else factchecks
+                evidence['wikipedia'] = wikipedia_future.result()
+                evidence['web_general'] = web_future.result()
             
             # 5. Compute aggregated summary
             evidence['summary'] = self._compute_evidence_summary(evidence)
             
+            # The fetchers return nothing on network errors, so an all-empty
+            # result may be an outage rather than an absence of evidence;
+            # it is not cached and the next verification retries
+            if self._has_evidence(evidence):
+                self._cache_evidence(cache_key, evidence)
+            
             print(f"✓ Evidence aggregation complete")
             return evidence
         
@@ -100,6 +148,54 @@ class EvidenceAggregator:
             print(f"Evidence aggregation error: {e}")
             return self._get_empty_evidence()
     
+    def _claim_fingerprint(
+        self,
+        text: str,
+        keywords: List[str],
+        location: Optional[str]
+    ) -> str:
+        """Cache key for a claim: case and whitespace differences are ignored"""
+        normalized = ' '.join(text.lower().split())
+        parts = [normalized, '|'.join(keywords), location or '']
+        return hashlib.sha1('\x00'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _has_evidence(self, evidence: Dict) -> bool:
+        """Whether any source returned something"""
+        return bool(
+            evidence['news']
+            or evidence['factcheck']
+            or evidence['web_general']
+            or evidence['wikipedia'].get('found')
+        )
+    
+    def _get_cached_evidence(self, key: str):
+        """Return cached evidence for key if it is younger than cache_ttl"""
+        with self._cache_lock:
+            entry = self._evidence_cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, evidence = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._evidence_cache[key]
+                return None
+            
+            self._evidence_cache.move_to_end(key)
+            return evidence
+    
+    def _cache_evidence(self, key: str, evidence: Dict):
+        """Store evidence, evicting the least recently used entries"""
+        with self._cache_lock:
+            self._evidence_cache[key] = (time.monotonic(), evidence)
+            self._evidence_cache.move_to_end(key)
+            while len(self._evidence_cache) > self.cache_max_entries:
+                self._evidence_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Forget all cached evidence"""
+        with self._cache_lock:
+            self._evidence_cache.clear()
+    
     def get_news_evidence(
         self, 
         text: str, 
@@ -149,6 +245,13 @@ class EvidenceAggregator:
             claim = text[:100] if len(text) > 100 else text
             claim = claim.split('.')[0]  # First sentence
             
+            # Verifiers query fact-checks ahead of the full aggregation, so
+            # the ruling for a claim is cached on its own
+            cache_key = 'factcheck:' + hashlib.sha1(claim.encode('utf-8')).hexdigest()
+            cached = self._get_cached_evidence(cache_key)
+            if cached is not None:
+                return cached
+            
             # Google Fact Check Tools API
             api_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
             
@@ -157,7 +260,7 @@ class EvidenceAggregator:
                 'languageCode': 'en'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 api_url, 
                 params=params, 
                 headers=self.headers,
@@ -181,6 +284,7 @@ class EvidenceAggregator:
                         'credibility': 'HIGH'
                     })
                 
+                self._cache_evidence(cache_key, factchecks)
                 return factchecks
             
             return []
@@ -219,7 +323,7 @@ class EvidenceAggregator:
             # Wikipedia API
             api_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{quote_plus(entity)}"
             
-            response = requests.get(api_url, headers=self.headers, timeout=10)
+            response = self.session.get(api_url, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -259,7 +363,7 @@ class EvidenceAggregator:
         try:
             url = f"https://news.google.com/search?q={quote_plus(query)}&hl=en-US&gl=US&ceid=US:en"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return []
@@ -309,7 +413,7 @@ class EvidenceAggregator:
         try:
             url = f"https://www.google.com/search?q={quote_plus(query)}"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return []
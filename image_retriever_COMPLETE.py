@@ -6,27 +6,89 @@ PERFECT Image Retriever
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from PIL import Image
 from io import BytesIO
-import time
-from typing import List, Dict
+from typing import List, Dict, Tuple, Callable, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dual_verifier import dhash
 import urllib.parse
 import random
 
+# Optional: simplejpeg (libjpeg-turbo) decodes JPEG much faster than Pillow
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+
+def decode_image(data: bytes, min_size: Tuple[int, int] = None) -> Image.Image:
+    """
+    Decode image bytes, using simplejpeg for JPEG when it is installed
+
+    Args:
+        data: Raw encoded image bytes
+        min_size: Optional (width, height) - JPEGs may be DCT-downscaled
+                  while keeping at least this many pixels per side
+    """
+    if simplejpeg is not None and simplejpeg.is_jpeg(data):
+        scale = {'min_width': min_size[0], 'min_height': min_size[1]} if min_size else {}
+        try:
+            image = Image.fromarray(simplejpeg.decode_jpeg(data, colorspace='RGB', **scale))
+        except ValueError:
+            pass  # Unsupported JPEG variant (e.g. CMYK) - fall back to Pillow
+        else:
+            # fromarray() carries no metadata; a header-only Pillow open
+            # recovers the EXIF block (capture date for temporal checks)
+            exif = Image.open(BytesIO(data)).info.get('exif')
+            if exif:
+                image.info['exif'] = exif
+            return image
+    
+    return Image.open(BytesIO(data))
+
+
+def create_pooled_session(pool_size: int) -> requests.Session:
+    """Create a requests.Session keeping up to pool_size connections per host"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class ImageRetrieverPerfect:
     """
     PERFECT Image Retriever - Exact matching only
     """
     
-    def __init__(self):
-        """Initialize"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize
+        
+        Args:
+            session: Optional requests.Session to share with other
+                     components (a pooled one is created otherwise)
+        """
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         ]
         
+        # Parallel image downloads per search
+        self.max_download_workers = 8
+        
+        # Downloaded images are downscaled to fit this box (display and
+        # verification only use small versions)
+        self.max_image_size = (512, 512)
+        
+        # One pooled session for all requests: concurrent downloads from the
+        # same host reuse kept-alive connections instead of a new TCP/TLS
+        # handshake each
+        self.session = session or create_pooled_session(self.max_download_workers)
+        
         print("✓ PERFECT Image Retriever initialized")
     
     def retrieve_images_for_text(
@@ -36,7 +98,8 @@ class ImageRetrieverPerfect:
         location: str = None,
         event_type: str = None,
         keywords: List[str] = None,
-        verification_keywords: List[str] = None
+        verification_keywords: List[str] = None,
+        on_image: Callable[[Dict], None] = None
     ) -> List[Dict]:
         """
         Retrieve images with EXACT matching
@@ -44,6 +107,9 @@ class ImageRetrieverPerfect:
         Args:
             query: Search query (already optimized)
             verification_keywords: Keywords that MUST appear in results
+            on_image: Optional callback, called with each image dict as soon
+                      as it is downloaded (before keyword filtering) so
+                      callers can show results progressively
         """
         try:
             print(f"\n🔍 EXACT IMAGE SEARCH")
@@ -60,7 +126,8 @@ class ImageRetrieverPerfect:
             ddg_images = self._search_duckduckgo_exact(
                 search_query,
                 verification_keywords or [],
-                max_images
+                max_images,
+                on_image
             )
             all_images.extend(ddg_images)
             print(f"     ✓ Matched {len(ddg_images)} images")
@@ -71,7 +138,8 @@ class ImageRetrieverPerfect:
                 bing_images = self._search_bing_exact(
                     search_query,
                     verification_keywords or [],
-                    max_images - len(all_images)
+                    max_images - len(all_images),
+                    on_image
                 )
                 all_images.extend(bing_images)
                 print(f"     ✓ Matched {len(bing_images)} images")
@@ -83,7 +151,8 @@ class ImageRetrieverPerfect:
                     location,
                     event_type or 'incident',
                     verification_keywords or [],
-                    max_images - len(all_images)
+                    max_images - len(all_images),
+                    on_image
                 )
                 all_images.extend(news_images)
                 print(f"     ✓ Matched {len(news_images)} images")
@@ -121,7 +190,8 @@ class ImageRetrieverPerfect:
         self,
         query: str,
         must_match_keywords: List[str],
-        max_images: int
+        max_images: int,
+        on_image: Callable[[Dict], None] = None
     ) -> List[Dict]:
         """
         DuckDuckGo search with keyword filtering
@@ -137,21 +207,17 @@ class ImageRetrieverPerfect:
             search_query = f'"{query}"'
             search_url = f"https://duckduckgo.com/?q={urllib.parse.quote(search_query)}&iax=images&ia=images"
             
-            session = requests.Session()
-            response = session.get(search_url, headers=headers, timeout=10)
+            response = self.session.get(search_url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 return []
             
             soup = BeautifulSoup(response.text, 'html.parser')
             
-            images = []
+            candidates = []
             img_elements = soup.find_all('img', limit=max_images * 5)  # Get more, filter later
             
             for img in img_elements:
-                if len(images) >= max_images * 2:  # Get extras for filtering
-                    break
-                
                 img_url = img.get('src') or img.get('data-src')
                 
                 if not img_url or img_url.startswith('data:') or 'logo' in img_url.lower():
@@ -166,23 +232,24 @@ class ImageRetrieverPerfect:
                 alt_text = img.get('alt', '').lower()
                 title = img.get('title', '').lower()
                 
-                # Download image
-                img_data = self._download_image(img_url, headers)
-                
-                if img_data:
-                    images.append({
-                        'image': img_data,
-                        'source': self._extract_domain(img_url),
-                        'name': alt_text or title or query,
-                        'url': img_url,
-                        'alt_text': alt_text,
-                        'title': title,
-                        'credibility': self._determine_credibility(img_url),
-                        'type': 'web',
-                        'platform': 'DuckDuckGo'
-                    })
-                
-                time.sleep(0.05)
+                candidates.append({
+                    'image': None,
+                    'source': self._extract_domain(img_url),
+                    'name': alt_text or title or query,
+                    'url': img_url,
+                    'alt_text': alt_text,
+                    'title': title,
+                    'credibility': self._determine_credibility(img_url),
+                    'type': 'web',
+                    'platform': 'DuckDuckGo'
+                })
+            
+            # Download images (get extras for filtering)
+            images = []
+            for image in self._download_candidates(candidates, headers, max_images * 2):
+                images.append(image)
+                if on_image:
+                    on_image(image)
             
             return images
         
@@ -194,7 +261,8 @@ class ImageRetrieverPerfect:
         self,
         query: str,
         must_match_keywords: List[str],
-        max_images: int
+        max_images: int,
+        on_image: Callable[[Dict], None] = None
     ) -> List[Dict]:
         """
         Bing search with keyword filtering
@@ -207,20 +275,17 @@ class ImageRetrieverPerfect:
             
             search_url = f"https://www.bing.com/images/search?q={urllib.parse.quote(query)}"
             
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.session.get(search_url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 return []
             
             soup = BeautifulSoup(response.text, 'html.parser')
             
-            images = []
+            candidates = []
             img_elements = soup.find_all('img', limit=max_images * 5)
             
             for img in img_elements:
-                if len(images) >= max_images * 2:
-                    break
-                
                 img_url = img.get('src') or img.get('data-src')
                 
                 if not img_url or img_url.startswith('data:'):
@@ -233,21 +298,22 @@ class ImageRetrieverPerfect:
                 
                 alt_text = img.get('alt', '').lower()
                 
-                img_data = self._download_image(img_url, headers)
-                
-                if img_data:
-                    images.append({
-                        'image': img_data,
-                        'source': self._extract_domain(img_url),
-                        'name': alt_text or query,
-                        'url': img_url,
-                        'alt_text': alt_text,
-                        'credibility': self._determine_credibility(img_url),
-                        'type': 'web',
-                        'platform': 'Bing'
-                    })
-                
-                time.sleep(0.05)
+                candidates.append({
+                    'image': None,
+                    'source': self._extract_domain(img_url),
+                    'name': alt_text or query,
+                    'url': img_url,
+                    'alt_text': alt_text,
+                    'credibility': self._determine_credibility(img_url),
+                    'type': 'web',
+                    'platform': 'Bing'
+                })
+            
+            images = []
+            for image in self._download_candidates(candidates, headers, max_images * 2):
+                images.append(image)
+                if on_image:
+                    on_image(image)
             
             return images
         
@@ -260,7 +326,8 @@ class ImageRetrieverPerfect:
         location: str,
         event_type: str,
         must_match_keywords: List[str],
-        max_images: int
+        max_images: int,
+        on_image: Callable[[Dict], None] = None
     ) -> List[Dict]:
         """
         Search specific news sites for exact incident
@@ -275,19 +342,25 @@ class ImageRetrieverPerfect:
             news_images = self._search_duckduckgo_exact(
                 news_query,
                 must_match_keywords,
-                max_images
+                max_images,
+                on_image=self._mark_as_news(on_image)
             )
             
-            # Mark as news
-            for img in news_images:
-                img['credibility'] = 'TIER1_NEWS'
-                img['type'] = 'news'
-            
             return news_images
         
-        except:
+        except Exception:
             return []
     
+    def _mark_as_news(self, on_image: Callable[[Dict], None] = None) -> Callable[[Dict], None]:
+        """Wrap an on_image callback so images are marked as news first"""
+        def mark(img: Dict):
+            img['credibility'] = 'TIER1_NEWS'
+            img['type'] = 'news'
+            if on_image:
+                on_image(img)
+        
+        return mark
+    
     def _filter_by_keywords(
         self,
         images: List[Dict],
@@ -356,25 +429,73 @@ class ImageRetrieverPerfect:
         
         return 'TIER2_WEB'
     
+    def _download_candidates(
+        self,
+        candidates: List[Dict],
+        headers: dict,
+        limit: int
+    ) -> Iterator[Dict]:
+        """
+        Download candidate images concurrently
+        
+        Yields candidates (with 'image' filled in) in search-result order,
+        each as soon as it and every higher-ranked download are done, stopping
+        once `limit` images are found. The kept images are the top-ranked
+        ones, as with sequential downloads, not the fastest to arrive.
+        """
+        if not candidates:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(self.max_download_workers, len(candidates)))
+        try:
+            futures = [
+                executor.submit(self._download_image, candidate['url'], headers)
+                for candidate in candidates
+            ]
+            
+            found = 0
+            for candidate, future in zip(candidates, futures):
+                img_data = future.result()
+                if not img_data:
+                    continue
+                
+                candidate['image'] = img_data
+                # Stored for the verifier's near-duplicate prefilter
+                candidate['dhash'] = dhash(img_data)
+                yield candidate
+                
+                found += 1
+                if found >= limit:
+                    break
+        finally:
+            # Don't wait for (or start) downloads we no longer need
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def _download_image(self, url: str, headers: dict) -> Image.Image:
         """Download and validate image"""
         try:
-            response = requests.get(url, headers=headers, timeout=5, stream=True)
-            
-            if response.status_code != 200:
-                return None
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if 'image' not in content_type.lower():
-                return None
-            
-            img = Image.open(BytesIO(response.content))
+            # Closing the response returns its connection to the pool, even
+            # when the body is never read
+            with self.session.get(url, headers=headers, timeout=5, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if 'image' not in content_type.lower():
+                    return None
+                
+                img = decode_image(response.content, self.max_image_size)
             
             # Validate size (not too small)
             if img.size[0] < 200 or img.size[1] < 200:
                 return None
             
+            # Downscale before the pixels are decoded: draft() lets libjpeg
+            # decode at reduced scale (no-op for other formats)
+            img.draft('RGB', self.max_image_size)
+            img.thumbnail(self.max_image_size, Image.Resampling.BILINEAR)
+            
             # Convert to RGB
             if img.mode != 'RGB':
                 img = img.convert('RGB')
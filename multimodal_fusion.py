@@ -10,9 +10,7 @@ This module:
 4. Lightweight and interpretable
 """
 
-import numpy as np
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from typing import Dict, List
 
 class AttentionFusion:
     """
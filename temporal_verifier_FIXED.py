@@ -8,13 +8,36 @@ Critical Fixes:
 """
 
 from PIL import Image
-from PIL.ExifTags import TAGS
+from PIL.ExifTags import Base, IFD
 import re
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Tuple
 import requests
 from bs4 import BeautifulSoup
 
+# Month names -> month number
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Date patterns, compiled once. All month names go into one alternation
+# (longest first, so 'june' wins over 'jun') instead of one pattern per month.
+_MONTH_NAMES = '|'.join(sorted(MONTHS, key=len, reverse=True))
+NUMERIC_DATE_PATTERN = re.compile(r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b')
+MONTH_DAY_YEAR_PATTERN = re.compile(rf'\b({_MONTH_NAMES})\s+(\d{{1,2}}),?\s+(\d{{4}})\b')
+MONTH_YEAR_PATTERN = re.compile(rf'\b({_MONTH_NAMES})\s+(\d{{4}})\b')
+NEWS_DATE_PATTERN = re.compile(rf'({_MONTH_NAMES})\s+(\d{{1,2}}),?\s+(\d{{4}})')
+YEAR_PATTERN = re.compile(r'\b(20\d{2})\b')
+
+# EXIF date tags in order of preference; the capture dates live in the Exif
+# sub-IFD, DateTime (last modified) in IFD0
+EXIF_IFD_DATE_TAGS = (Base.DateTimeOriginal, Base.DateTimeDigitized)
+IFD0_DATE_TAGS = (Base.DateTime,)
+
 class TemporalVerifierFixed:
     """
     FIXED Temporal Verifier
@@ -26,10 +49,18 @@ class TemporalVerifierFixed:
     4. Shows correction: "You said 2023 but actually happened in 2024"
     """
     
-    def __init__(self):
-        """Initialize temporal verifier"""
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize temporal verifier
+        
+        Args:
+            session: Optional requests.Session to share keep-alive
+                     connections with other components
+        """
         print("✓ FIXED Temporal Verifier initialized")
         
+        self.session = session or requests.Session()
+        
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -43,13 +74,7 @@ class TemporalVerifierFixed:
         }
         
         # Month names
-        self.months = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12,
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
+        self.months = MONTHS
     
     def verify_temporal_consistency(
         self, 
@@ -74,8 +99,16 @@ class TemporalVerifierFixed:
             claimed_dates = self.extract_all_text_dates(text)
             print(f"  📝 Claimed dates from text: {claimed_dates}")
             
-            # Step 2: Search web for ACTUAL event date
-            actual_date = self.search_actual_event_date(text, keywords)
+            # Step 2: Search web for ACTUAL event date. Every mismatch check
+            # compares against a claimed date, so without one the search is
+            # skipped: no mismatch can be found either way. The reported
+            # result does change then: with no EXIF date either it is
+            # NO_TEMPORAL_INFO (confidence 0), where a date found on the web
+            # used to give DATES_CONSISTENT (confidence 70).
+            if claimed_dates:
+                actual_date = self.search_actual_event_date(text, keywords)
+            else:
+                actual_date = None
             print(f"  🌐 Actual date from web: {actual_date}")
             
             # Step 3: Extract image EXIF date
@@ -108,8 +141,7 @@ class TemporalVerifierFixed:
         current_date = datetime.now()
         
         # Pattern 1: Explicit dates (DD/MM/YYYY, DD-MM-YYYY)
-        pattern1 = r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b'
-        matches1 = re.finditer(pattern1, text)
+        matches1 = NUMERIC_DATE_PATTERN.finditer(text)
         for match in matches1:
             day, month, year = match.groups()
             try:
@@ -124,43 +156,36 @@ class TemporalVerifierFixed:
                 pass
         
         # Pattern 2: Month DD, YYYY (e.g., "December 25, 2024")
-        for month_name, month_num in self.months.items():
-            pattern = rf'\b{month_name}\s+(\d{{1,2}}),?\s+(\d{{4}})\b'
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                day, year = match.groups()
-                try:
-                    date = datetime(int(year), month_num, int(day))
-                    dates_found.append({
-                        'date': date,
-                        'format': 'Month DD, YYYY',
-                        'text': match.group(0),
-                        'confidence': 0.95
-                    })
-                except:
-                    pass
+        for match in MONTH_DAY_YEAR_PATTERN.finditer(text_lower):
+            month_name, day, year = match.groups()
+            try:
+                date = datetime(int(year), self.months[month_name], int(day))
+                dates_found.append({
+                    'date': date,
+                    'format': 'Month DD, YYYY',
+                    'text': match.group(0),
+                    'confidence': 0.95
+                })
+            except:
+                pass
         
         # Pattern 3: Just Month YYYY
-        for month_name, month_num in self.months.items():
-            pattern = rf'\b{month_name}\s+(\d{{4}})\b'
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                year = match.groups()[0]
-                try:
-                    # Middle of month
-                    date = datetime(int(year), month_num, 15)
-                    dates_found.append({
-                        'date': date,
-                        'format': 'Month YYYY',
-                        'text': match.group(0),
-                        'confidence': 0.80
-                    })
-                except:
-                    pass
+        for match in MONTH_YEAR_PATTERN.finditer(text_lower):
+            month_name, year = match.groups()
+            try:
+                # Middle of month
+                date = datetime(int(year), self.months[month_name], 15)
+                dates_found.append({
+                    'date': date,
+                    'format': 'Month YYYY',
+                    'text': match.group(0),
+                    'confidence': 0.80
+                })
+            except:
+                pass
         
         # Pattern 4: Just year (YYYY)
-        year_pattern = r'\b(20\d{2})\b'
-        years = re.finditer(year_pattern, text)
+        years = YEAR_PATTERN.finditer(text)
         for match in years:
             year = int(match.group(1))
             # Middle of year
@@ -219,7 +244,7 @@ class TemporalVerifierFixed:
             # Search Google News
             url = f"https://www.google.com/search?q={requests.utils.quote(search_query)}&tbm=nws"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return None
@@ -237,25 +262,21 @@ class TemporalVerifierFixed:
                 
                 # Extract dates from snippet
                 # Pattern: Month DD, YYYY
-                for month_name, month_num in self.months.items():
-                    pattern = rf'{month_name}\s+(\d{{1,2}}),?\s+(\d{{4}})'
-                    matches = re.finditer(pattern, text_content.lower())
-                    for match in matches:
-                        day, year = match.groups()
-                        try:
-                            date = datetime(int(year), month_num, int(day))
-                            dates_in_news.append({
-                                'date': date,
-                                'source': 'news',
-                                'text': match.group(0),
-                                'confidence': 0.85
-                            })
-                        except:
-                            pass
+                for match in NEWS_DATE_PATTERN.finditer(text_content.lower()):
+                    month_name, day, year = match.groups()
+                    try:
+                        date = datetime(int(year), self.months[month_name], int(day))
+                        dates_in_news.append({
+                            'date': date,
+                            'source': 'news',
+                            'text': match.group(0),
+                            'confidence': 0.85
+                        })
+                    except:
+                        pass
                 
                 # Pattern: YYYY
-                year_pattern = r'\b(20\d{2})\b'
-                years = re.finditer(year_pattern, text_content)
+                years = YEAR_PATTERN.finditer(text_content)
                 for match in years:
                     year = int(match.group(1))
                     date = datetime(year, 6, 15)
@@ -280,19 +301,21 @@ class TemporalVerifierFixed:
             return None
     
     def extract_image_date(self, image: Image.Image) -> Optional[datetime]:
-        """Extract date from image EXIF (unchanged)"""
+        """Extract date from image EXIF (capture date preferred)"""
         try:
-            exif_data = image._getexif()
+            # getexif() reads IFD0 only; the Exif sub-IFD is parsed on demand
+            # and only the date tags are looked up (no full tag-name dict)
+            exif_data = image.getexif()
             
             if not exif_data:
                 return None
             
-            date_tags = ['DateTimeOriginal', 'DateTime', 'DateTimeDigitized']
+            exif_ifd = exif_data.get_ifd(IFD.Exif)
+            candidates = [exif_ifd.get(tag) for tag in EXIF_IFD_DATE_TAGS]
+            candidates += [exif_data.get(tag) for tag in IFD0_DATE_TAGS]
             
-            for tag_id, value in exif_data.items():
-                tag_name = TAGS.get(tag_id, tag_id)
-                
-                if tag_name in date_tags:
+            for value in candidates:
+                if value:
                     date_str = str(value)
                     
                     try:
@@ -0,0 +1,37 @@
+"""
+Tests for image_retriever_COMPLETE.decode_image
+"""
+
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from PIL.ExifTags import Base, IFD
+
+import image_retriever_COMPLETE
+from image_retriever_COMPLETE import decode_image
+from temporal_verifier_FIXED import TemporalVerifierFixed
+
+
+def make_jpeg_with_capture_date(capture_date: str) -> bytes:
+    """Encode a small JPEG whose Exif sub-IFD holds DateTimeOriginal"""
+    exif = Image.Exif()
+    exif.get_ifd(IFD.Exif)[Base.DateTimeOriginal] = capture_date
+    buffer = BytesIO()
+    Image.new('RGB', (64, 48), (200, 80, 40)).save(buffer, format='JPEG', exif=exif)
+    return buffer.getvalue()
+
+
+def test_pillow_decode_keeps_exif_date(monkeypatch):
+    monkeypatch.setattr(image_retriever_COMPLETE, 'simplejpeg', None)
+    image = decode_image(make_jpeg_with_capture_date('2024:12:01 10:30:00'))
+    
+    assert TemporalVerifierFixed().extract_image_date(image) == datetime(2024, 12, 1, 10, 30)
+
+
+def test_simplejpeg_decode_keeps_exif_date():
+    pytest.importorskip('simplejpeg')
+    image = decode_image(make_jpeg_with_capture_date('2024:12:01 10:30:00'), (32, 24))
+    
+    assert TemporalVerifierFixed().extract_image_date(image) == datetime(2024, 12, 1, 10, 30)
@@ -0,0 +1,28 @@
+"""
+Tests for temporal_verifier_FIXED.TemporalVerifierFixed
+"""
+
+from PIL import Image
+
+from temporal_verifier_FIXED import TemporalVerifierFixed
+
+
+def test_no_claimed_date_skips_web_search(monkeypatch):
+    verifier = TemporalVerifierFixed()
+    searches = []
+    monkeypatch.setattr(
+        verifier,
+        'search_actual_event_date',
+        lambda text, keywords=None: searches.append(text)
+    )
+    
+    result = verifier.verify_temporal_consistency(
+        'Bridge collapse in Chennai injures several people',
+        Image.new('RGB', (32, 32))
+    )
+    
+    assert searches == []
+    assert result['has_mismatch'] is False
+    assert result['verdict'] == 'NO_TEMPORAL_INFO'
+    assert result['confidence'] == 0
+    assert result['actual_date'] is None
@@ -0,0 +1,82 @@
+"""
+Tests for enhanced_dual_verifier.EnhancedDualVerifier.verify_batch
+"""
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+
+@pytest.fixture
+def verifier(monkeypatch):
+    """A verifier without its modules: verify_batch only calls verify_text_and_image"""
+    # enhanced_dual_verifier imports temporal_verifier, which is not in this tree
+    monkeypatch.setitem(
+        sys.modules,
+        'temporal_verifier',
+        types.SimpleNamespace(TemporalVerifier=object)
+    )
+    from enhanced_dual_verifier import EnhancedDualVerifier
+    
+    return EnhancedDualVerifier.__new__(EnhancedDualVerifier)
+
+
+def test_verify_batch_keeps_order_and_looks_up_repeats_once(verifier, monkeypatch):
+    evidence_cache = {}
+    lookups = []
+    lock = threading.Lock()
+    
+    def verify_text_and_image(text, user_image, text_images, image_images, text_info=None):
+        # Stands in for the evidence cache: a miss fetches, slowly enough
+        # that claims running concurrently would all miss
+        key = ' '.join(text.lower().split())
+        with lock:
+            cached = key in evidence_cache
+        if not cached:
+            time.sleep(0.05)
+            with lock:
+                lookups.append(key)
+                evidence_cache[key] = True
+        return {'text': text, 'image': user_image}
+    
+    monkeypatch.setattr(verifier, 'verify_text_and_image', verify_text_and_image)
+    
+    items = [
+        {'text': 'Chennai floods', 'user_image': 0},
+        {'text': 'Delhi fire', 'user_image': 1},
+        {'text': 'chennai  FLOODS', 'user_image': 2},
+        {'text': 'Chennai floods', 'user_image': 3},
+        {'text': 'Delhi fire', 'user_image': 4},
+    ]
+    
+    results = verifier.verify_batch(items)
+    
+    assert [(r['text'], r['image']) for r in results] == [
+        (item['text'], item['user_image']) for item in items
+    ]
+    assert sorted(lookups) == ['chennai floods', 'delhi fire']
+
+
+def test_verify_batch_runs_repeats_of_one_claim_concurrently(verifier, monkeypatch):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    
+    def verify_text_and_image(text, user_image, text_images, image_images, text_info=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return {}
+    
+    monkeypatch.setattr(verifier, 'verify_text_and_image', verify_text_and_image)
+    
+    verifier.verify_batch([{'text': 'Chennai floods', 'user_image': None}] * 5, max_workers=4)
+    
+    assert peak == 4
@@ -54,10 +54,14 @@ class TextProcessorPerfect:
         print("✓ PERFECT Text Processor initialized!")
     
     def _load_spacy(self):
-        """Try to load spaCy"""
+        """Try to load spaCy (NER only - other pipes are never used)"""
         try:
             import spacy
-            nlp = spacy.load("en_core_web_sm")
+            # Excluded components are neither loaded nor run per call
+            nlp = spacy.load(
+                "en_core_web_sm",
+                exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+            )
             print("✓ spaCy loaded")
             return nlp
         except: